@@ -1,9 +1,11 @@
 import sys
+from collections import Counter
 from dataclasses import dataclass, field
 from enum import StrEnum
 from itertools import islice
 from pathlib import Path
-from typing import Any, Iterable
+from random import Random
+from typing import Any, Iterable, Optional
 
 
 WIDTH = 10
@@ -24,6 +26,9 @@ COLUMNS = {
 }
 COLUMN_NAMES = list(COLUMNS.keys())
 
+# Размер корабля: количество
+FLEET = {4: 1, 3: 2, 2: 3, 1: 4}
+
 
 @dataclass
 class Ship:
@@ -95,6 +100,129 @@ def check(ships: dict[tuple[int, int], Ship], shot: tuple[int, int]) -> Result:
         return Result.MISS
 
 
+@dataclass(frozen=True)
+class Placement:
+    row: int
+    col: int
+    size: int
+    vertical: bool
+    cells: int  # битовая маска клеток корабля, бит row * width + col
+    halo: int  # клетки корабля и все соседние, включая диагональные
+
+    def ship(self) -> Ship:
+        return Ship(self.row, self.col, self.size, self.vertical)
+
+
+def _mask(cells: Iterable[tuple[int, int]], width: int, height: int) -> int:
+    mask = 0
+    for row, col in cells:
+        if 0 <= row < height and 0 <= col < width:
+            mask |= 1 << (row * width + col)
+    return mask
+
+
+def placements(size: int, width: int = WIDTH, height: int = HEIGHT) -> list[Placement]:
+    result = []
+    for vertical in (False, True) if size > 1 else (False,):
+        rows = height - size + 1 if vertical else height
+        cols = width if vertical else width - size + 1
+        for row in range(rows):
+            for col in range(cols):
+                cells = [(row + i, col) if vertical else (row, col + i) for i in range(size)]
+                halo = [(r + dr, c + dc) for r, c in cells for dr in (-1, 0, 1) for dc in (-1, 0, 1)]
+                result.append(Placement(row, col, size, vertical,
+                                        _mask(cells, width, height), _mask(halo, width, height)))
+    return result
+
+
+PLACEMENTS = {size: placements(size) for size in FLEET}
+
+
+def _place(
+    rng: Random,
+    sizes: list[int],
+    forbidden: int,
+    pool: list[Placement] = None,
+) -> Optional[list[Placement]]:
+    if not sizes:
+        return []
+    # Кандидаты для корабля того же размера — остаток кандидатов предыдущего
+    if pool is None:
+        pool = PLACEMENTS[sizes[0]]
+    candidates = [p for p in pool if not p.cells & forbidden]
+    while candidates:
+        i = rng.randrange(len(candidates))
+        p = candidates[i]
+        candidates[i] = candidates[-1]
+        candidates.pop()
+        same = len(sizes) > 1 and sizes[1] == sizes[0]
+        rest = _place(rng, sizes[1:], forbidden | p.halo, candidates if same else None)
+        if rest is not None:
+            return [p, *rest]
+    return None
+
+
+def random_fleet(rng: Random = None) -> list[Ship]:
+    """Случайная расстановка стандартного флота по правилам: корабли не касаются даже углами"""
+    sizes = [size for size, n in sorted(FLEET.items(), reverse=True) for _ in range(n)]
+    return [p.ship() for p in _place(rng or Random(), sizes, 0)]
+
+
+def fleet_lines(ships: Iterable[Ship], width: int = WIDTH, height: int = HEIGHT) -> list[str]:
+    """Поле из '0' и '1' в формате read_ships"""
+    grid = [['0'] * width for _ in range(height)]
+    for ship in ships:
+        for i in range(ship.size):
+            if ship.vertical:
+                grid[ship.row + i][ship.col] = '1'
+            else:
+                grid[ship.row][ship.col + i] = '1'
+    return [''.join(row) for row in grid]
+
+
+def validate(f: Iterable[str], width: int = WIDTH, height: int = HEIGHT) -> list[str]:
+    """Нарушения правил расстановки в поле для read_ships; пустой список — расстановка верна"""
+    cells = {(row, col)
+             for row, line in enumerate(islice(f, height))
+             for col, c in enumerate(line.strip()[0:width]) if c == '1'}
+    ships, seen = [], set()
+    for start in sorted(cells):
+        if start in seen:
+            continue
+        ship, stack = [], [start]
+        seen.add(start)
+        while stack:
+            row, col = stack.pop()
+            ship.append((row, col))
+            for cell in ((row - 1, col), (row + 1, col), (row, col - 1), (row, col + 1)):
+                if cell in cells and cell not in seen:
+                    seen.add(cell)
+                    stack.append(cell)
+        ships.append(sorted(ship))
+
+    errors = []
+    owner = {cell: i for i, ship in enumerate(ships) for cell in ship}
+    touching = set()
+    for i, ship in enumerate(ships):
+        name = coords_to_shot(*ship[0])
+        rows, cols = {r for r, _ in ship}, {c for _, c in ship}
+        if len(rows) > 1 and len(cols) > 1:
+            errors.append(f'Корабль {name} не прямой')
+        if len(ship) > max(FLEET):
+            errors.append(f'Корабль {name} длиннее {max(FLEET)} клеток')
+        for row, col in ship:
+            for dr, dc in ((-1, -1), (-1, 1), (1, -1), (1, 1)):
+                j = owner.get((row + dr, col + dc), i)
+                if j != i and (j, i) not in touching:
+                    touching.add((i, j))
+                    errors.append(f'Корабли {name} и {coords_to_shot(*ships[j][0])} касаются углами')
+    sizes = Counter(len(ship) for ship in ships)
+    for size, n in FLEET.items():
+        if sizes[size] != n:
+            errors.append(f'Кораблей из {size} клеток: {sizes[size]} вместо {n}')
+    return errors
+
+
 def battleship(i: str = 'input.txt', o: str = 'output.txt') -> None:
     with open(i, 'r', encoding='utf-8') as f:
         ships = read_ships(f)
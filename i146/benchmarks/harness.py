@@ -0,0 +1,112 @@
+"""Shared benchmark helpers: input distributions, timing, complexity fits"""
+import json
+import math
+import platform
+import sys
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from random import Random
+from time import perf_counter
+from typing import Any, Callable
+
+
+def uniform(n: int, rng: Random) -> list[int]:
+    return [rng.randrange(n * 4 or 1) for _ in range(n)]
+
+
+def ascending(n: int, rng: Random) -> list[int]:
+    return list(range(n))
+
+
+def descending(n: int, rng: Random) -> list[int]:
+    return list(range(n, 0, -1))
+
+
+def few_unique(n: int, rng: Random) -> list[int]:
+    return [rng.randrange(8) for _ in range(n)]
+
+
+def organ_pipe(n: int, rng: Random) -> list[int]:
+    half = n // 2
+    return list(range(half)) + list(range(n - half, 0, -1))
+
+
+DISTRIBUTIONS: dict[str, Callable[[int, Random], list]] = {
+    'random': uniform,
+    'sorted': ascending,
+    'reversed': descending,
+    'few-unique': few_unique,
+    'organ-pipe': organ_pipe,
+}
+
+MODELS: dict[str, Callable[[int], float]] = {
+    'O(n)': lambda n: n,
+    'O(n log n)': lambda n: n * math.log2(n),
+    'O(n²)': lambda n: n * n,
+}
+
+
+def best_of(f: Callable[[], Any], repeat: int = 3) -> float:
+    best = math.inf
+    for _ in range(repeat):
+        start = perf_counter()
+        f()
+        best = min(best, perf_counter() - start)
+    return best
+
+
+def fit(sizes: list[int], times: list[float]) -> tuple[str, float]:
+    """Least-squares fit t = c·f(n) over MODELS; returns the best model and the log-log slope."""
+    points = [(n, t) for n, t in zip(sizes, times) if n > 1 and t > 0]
+    if len(points) < 2:
+        return '', math.nan
+    best, best_error = '', math.inf
+    for name, f in MODELS.items():
+        c = sum(t * f(n) for n, t in points) / sum(f(n) ** 2 for n, _ in points)
+        error = sum((math.log(c * f(n) / t)) ** 2 for n, t in points)
+        if error < best_error:
+            best, best_error = name, error
+    xs = [math.log(n) for n, _ in points]
+    ys = [math.log(t) for _, t in points]
+    mx, my = sum(xs) / len(xs), sum(ys) / len(ys)
+    slope = sum((x - mx) * (y - my) for x, y in zip(xs, ys)) / sum((x - mx) ** 2 for x in xs)
+    return best, slope
+
+
+@dataclass
+class Measurement:
+    algorithm: str
+    distribution: str
+    size: int
+    seconds: float
+    correct: bool
+
+
+@dataclass
+class Report:
+    measurements: list[Measurement] = field(default_factory=list)
+    fits: dict[str, dict[str, Any]] = field(default_factory=dict)
+
+    def add(self, m: Measurement) -> None:
+        self.measurements.append(m)
+
+    def fit(self) -> None:
+        series: dict[tuple[str, str], list[Measurement]] = {}
+        for m in self.measurements:
+            series.setdefault((m.algorithm, m.distribution), []).append(m)
+        for (algorithm, distribution), ms in series.items():
+            model, slope = fit([m.size for m in ms], [m.seconds for m in ms])
+            self.fits.setdefault(algorithm, {})[distribution] = {'model': model, 'slope': round(slope, 3)}
+
+    @property
+    def failures(self) -> list[Measurement]:
+        return [m for m in self.measurements if not m.correct]
+
+    def save(self, path: str | Path) -> None:
+        data = {
+            'python': sys.version,
+            'platform': platform.platform(),
+            'measurements': [asdict(m) for m in self.measurements],
+            'fits': self.fits,
+        }
+        Path(path).write_text(json.dumps(data, ensure_ascii=False, indent=2), encoding='utf-8')
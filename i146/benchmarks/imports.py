@@ -0,0 +1,84 @@
+"""Import-time budget check based on `python -X importtime`
+
+    python -m i146.benchmarks.imports [--repeat 5] [--output imports.json]
+
+Exits with 1 when a module takes longer than its budget to import or
+pulls in a dependency that must stay lazy.
+"""
+import argparse
+import json
+import subprocess
+import sys
+from pathlib import Path
+from typing import Optional
+
+# Module: (budget in milliseconds, modules that must not be imported with it).
+# Budgets include the standard library modules each import pulls in and
+# leave about 2x headroom over a cold start on a laptop.
+BUDGETS: dict[str, tuple[float, tuple[str, ...]]] = {
+    'i146.util': (15, ()),
+    'i146.numsys.positional': (90, ()),
+    'i146.numsys.problems': (110, ('yaml', 'mashumaro', 'numpy')),
+    'i146.numsys.serialization': (130, ('yaml', 'mashumaro', 'numpy')),
+    'i146.sorting': (50, ('numpy', 'multiprocessing', 'concurrent')),
+    'i146.caesar': (10, ()),
+    'i146.battleship': (90, ()),
+    'i146.tic_tac_toe.__main__': (110, ()),
+}
+
+
+def import_time(module: str) -> Optional[tuple[float, set[str]]]:
+    """Cumulative import time of the module in milliseconds and all modules it imported
+
+    None if the module fails to import.
+    """
+    p = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', f'import {module}'],
+        capture_output=True, text=True,
+    )
+    if p.returncode:
+        return None
+    total, imported = 0, set()
+    for line in p.stderr.splitlines():
+        if not line.startswith('import time:') or 'cumulative' in line:
+            continue
+        _, cumulative_us, name = line.split('|')
+        name = name.rstrip()
+        imported.add(name.strip())
+        # Top-level entries have a single space of indentation
+        if name.startswith(' i146'):
+            total += int(cumulative_us)
+    return total / 1000, imported
+
+
+def main(argv: list[str] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--modules', nargs='+', choices=BUDGETS, default=list(BUDGETS))
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument('--output', help='save results as JSON')
+    args = parser.parse_args(argv)
+
+    failed, results = False, {}
+    for module in args.modules:
+        budget, forbidden = BUDGETS[module]
+        runs = [import_time(module) for _ in range(args.repeat)]
+        if None in runs:
+            failed = True
+            results[module] = {'ms': None, 'budget': budget, 'leaked': []}
+            print(f'{module:>28} {"":>8}    / {budget:5.1f} ms FAILED')
+            continue
+        ms = min(t for t, _ in runs)
+        leaked = sorted({m for _, imported in runs for m in imported
+                         if m.split('.')[0] in forbidden or m in forbidden})
+        ok = ms <= budget and not leaked
+        failed |= not ok
+        results[module] = {'ms': ms, 'budget': budget, 'leaked': leaked}
+        status = 'ok' if ok else 'OVER BUDGET' if ms > budget else 'LEAK'
+        print(f'{module:>28} {ms:8.2f} ms / {budget:5.1f} ms {status} {" ".join(leaked)}')
+    if args.output:
+        Path(args.output).write_text(json.dumps(results, indent=2), encoding='utf-8')
+    return 1 if failed else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
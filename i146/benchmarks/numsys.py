@@ -0,0 +1,112 @@
+"""Differential check of numsys conversions against the original numsys_old code
+
+    python -m i146.benchmarks.numsys [--count 20000] [--seed 0]
+
+The reference dec/num below are the original implementations from
+i146.numsys_old. Every randomized input is converted by them and by
+numsys_old, numsys.positional and Numeral; exits with 1 on any mismatch.
+"""
+import argparse
+import sys
+from random import Random
+from typing import Callable
+
+from i146 import numsys_old
+from i146.benchmarks.harness import Measurement, Report, best_of
+from i146.numsys.positional import MAX_BASE, MIN_BASE, Numeral, int_to_string, string_to_int
+from i146.util import subscript
+
+# Bit lengths of the random integers
+WIDTHS = {'small': 16, 'word': 64, 'big': 512}
+
+
+def reference_dec(x: str, base: int) -> int:
+    dec = 0
+    for digit in x.upper():
+        if '0' <= digit <= '9':
+            digit = ord(digit) - ord('0')
+        elif 'A' <= digit <= 'Z':
+            digit = ord(digit) - ord('A') + 10
+        assert 0 <= digit < base, f'A digit ({digit}) must be less than the base ({base})'
+        dec = dec * base + digit
+    return dec
+
+
+def reference_num(dec: int, base: int) -> str:
+    x = []
+    while dec:
+        dec, digit = divmod(dec, base)
+        if digit >= 10:
+            digit = chr(digit + ord('A') - 10)
+        else:
+            digit = chr(digit + ord('0'))
+        x.append(digit)
+    # The original returned '' for zero; positional spells it '0'
+    return ''.join(reversed(x)) or '0'
+
+
+def random_cases(count: int, bits: int, rng: Random) -> list[tuple[int, str, int]]:
+    """(integer, its numeral with digits in random case, base)"""
+    cases = []
+    for _ in range(count):
+        base = rng.randint(MIN_BASE, MAX_BASE)
+        x = rng.getrandbits(rng.randint(0, bits))
+        s = ''.join(d.lower() if rng.getrandbits(1) else d for d in reference_num(x, base))
+        cases.append((x, s, base))
+    return cases
+
+
+def candidates() -> dict[str, tuple[Callable[[int, int], str], Callable[[str, int], int]]]:
+    """Implementation name: (int -> numeral, numeral -> int)"""
+    return {
+        'reference': (reference_num, reference_dec),
+        'numsys_old': (numsys_old.num, numsys_old.dec),
+        'positional': (int_to_string, string_to_int),
+        'Numeral': (lambda x, base: str(Numeral(x, base)).removesuffix(subscript(base)),
+                    lambda s, base: int(Numeral(s, base))),
+    }
+
+
+def mismatches(to_string: Callable, to_int: Callable, cases: list[tuple[int, str, int]]) -> list[str]:
+    errors = []
+    for x, s, base in cases:
+        if (r := to_string(x, base)) != reference_num(x, base):
+            errors.append(f'{x} in base {base}: {r!r}, expected {reference_num(x, base)!r}')
+        if (r := to_int(s, base)) != x:
+            errors.append(f'{s!r} in base {base}: {r}, expected {x}')
+    return errors
+
+
+def run(widths: list[str], count: int, repeat: int = 3, seed: int = 0) -> Report:
+    report = Report()
+    for width in widths:
+        cases = random_cases(count, WIDTHS[width], Random(seed))
+        for name, (to_string, to_int) in candidates().items():
+            errors = mismatches(to_string, to_int, cases)
+            for error in errors[:5]:
+                print(f'{name}: {error}', file=sys.stderr)
+            seconds = best_of(lambda: [to_int(to_string(x, base), base) for x, _, base in cases], repeat)
+            report.add(Measurement(name, width, count, seconds, not errors))
+    return report
+
+
+def main(argv: list[str] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--widths', nargs='+', choices=WIDTHS, default=list(WIDTHS))
+    parser.add_argument('--count', type=int, default=20_000)
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--output', help='save results as JSON')
+    args = parser.parse_args(argv)
+
+    report = run(args.widths, args.count, args.repeat, args.seed)
+    for m in report.measurements:
+        status = 'ok' if m.correct else 'MISMATCH'
+        print(f'{m.algorithm:>12} {m.distribution:>6} {m.size:>7} {m.seconds:10.6f}s {status}')
+    if args.output:
+        report.save(args.output)
+    return 1 if report.failures else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
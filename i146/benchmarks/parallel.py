@@ -0,0 +1,58 @@
+"""Speedup of i146.sorting.parallel_sort over quickSort and sorted()
+
+    python -m i146.benchmarks.parallel --sizes 1000000 4000000 --output parallel.json
+"""
+import argparse
+import os
+import sys
+from random import Random
+
+from i146 import sorting
+from i146.benchmarks.harness import Measurement, Report, best_of
+
+# quickSort is pure Python and gets slow on big inputs
+QUICKSORT_LIMIT = 2_000_000
+
+
+def run(sizes: list[int], processes: list[int], repeat: int = 1, seed: int = 0) -> Report:
+    report = Report()
+    for n in sizes:
+        rng = Random(seed)
+        data = [rng.random() for _ in range(n)]
+        expected = sorted(data)
+        candidates = {'sorted': sorted}
+        if n <= QUICKSORT_LIMIT:
+            candidates['quickSort'] = sorting.quickSort
+        for p in processes:
+            candidates[f'parallel_sort/{p}'] = lambda a, p=p: sorting.parallel_sort(a, p)
+        for name, f in candidates.items():
+            result = f(data[:])
+            seconds = best_of(lambda: f(data[:]), repeat)
+            report.add(Measurement(name, 'random', n, seconds, result == expected))
+    return report
+
+
+def main(argv: list[str] = None) -> int:
+    cpus = os.cpu_count() or 1
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--sizes', nargs='+', type=int, default=[250_000, 1_000_000, 4_000_000])
+    parser.add_argument('--processes', nargs='+', type=int,
+                        default=sorted({1, 2, 4, cpus} & set(range(1, cpus + 1))))
+    parser.add_argument('--repeat', type=int, default=1)
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--output', help='save results as JSON')
+    args = parser.parse_args(argv)
+
+    report = run(args.sizes, args.processes, args.repeat, args.seed)
+    baseline = {m.size: m.seconds for m in report.measurements if m.algorithm == 'sorted'}
+    for m in report.measurements:
+        status = 'ok' if m.correct else 'WRONG'
+        speedup = baseline[m.size] / m.seconds
+        print(f'{m.algorithm:>18} {m.size:>9} {m.seconds:10.4f}s x{speedup:5.2f} vs sorted {status}')
+    if args.output:
+        report.save(args.output)
+    return 1 if report.failures else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,59 @@
+"""Selection and top-k in i146.sorting against full sorting
+
+    python -m i146.benchmarks.selection --sizes 100000 1000000 --k 10 1000
+"""
+import argparse
+import heapq
+import sys
+from random import Random
+
+from i146 import sorting
+from i146.benchmarks.harness import DISTRIBUTIONS, Measurement, Report, best_of
+
+
+def run(distributions: list[str], sizes: list[int], ks: list[int], repeat: int = 3, seed: int = 0) -> Report:
+    report = Report()
+    for distribution in distributions:
+        for n in sizes:
+            data = DISTRIBUTIONS[distribution](n, Random(seed))
+            expected = sorted(data)
+            candidates = {
+                'select': (lambda a: sorting.select(a, n // 2), expected[n // 2]),
+                'sorted()[n/2]': (lambda a: sorted(a)[n // 2], expected[n // 2]),
+            }
+            for k in ks:
+                candidates.update({
+                    f'nsmallest/{k}': (lambda a, k=k: sorting.nsmallest(a, k), expected[:k]),
+                    f'nsmallest(iter)/{k}': (lambda a, k=k: sorting.nsmallest(iter(a), k), expected[:k]),
+                    f'heapq.nsmallest/{k}': (lambda a, k=k: heapq.nsmallest(k, a), expected[:k]),
+                    f'partial_sort/{k}': (lambda a, k=k: sorting.partial_sort(a, k)[:k], expected[:k]),
+                    f'sorted()[:{k}]': (lambda a, k=k: sorted(a)[:k], expected[:k]),
+                })
+            for name, (f, result) in candidates.items():
+                correct = f(data[:]) == result
+                seconds = best_of(lambda: f(data[:]), repeat)
+                report.add(Measurement(name, distribution, n, seconds, correct))
+    return report
+
+
+def main(argv: list[str] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--distributions', nargs='+', choices=DISTRIBUTIONS, default=['random', 'few-unique'])
+    parser.add_argument('--sizes', nargs='+', type=int, default=[10_000, 100_000, 1_000_000])
+    parser.add_argument('--k', nargs='+', type=int, default=[10, 1000])
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--output', help='save results as JSON')
+    args = parser.parse_args(argv)
+
+    report = run(args.distributions, args.sizes, args.k, args.repeat, args.seed)
+    for m in report.measurements:
+        status = 'ok' if m.correct else 'WRONG'
+        print(f'{m.algorithm:>22} {m.distribution:>10} {m.size:>9} {m.seconds:12.6f}s {status}')
+    if args.output:
+        report.save(args.output)
+    return 1 if report.failures else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
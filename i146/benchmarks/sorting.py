@@ -0,0 +1,69 @@
+"""Benchmark and differential check of i146.sorting against sorted()
+
+    python -m i146.benchmarks.sorting --sizes 100 1000 10000 --output sorting.json
+"""
+import argparse
+import sys
+from random import Random
+from typing import Callable
+
+from i146 import sorting
+from i146.benchmarks.harness import DISTRIBUTIONS, Measurement, Report, best_of
+
+# Quadratic algorithms only run up to the given input size
+ALGORITHMS: dict[str, tuple[Callable[[list], list], int]] = {
+    'bubble_sort': (sorting.bubble_sort, 2_000),
+    'selection_sort': (sorting.selection_sort, 2_000),
+    'insertion_sort': (sorting.insertion_sort, 2_000),
+    'quickSort': (sorting.quickSort, sys.maxsize),
+    'sorted': (sorted, sys.maxsize),
+}
+
+
+def run(
+    algorithms: list[str],
+    distributions: list[str],
+    sizes: list[int],
+    repeat: int = 3,
+    seed: int = 0,
+) -> Report:
+    report = Report()
+    for distribution in distributions:
+        for n in sizes:
+            data = DISTRIBUTIONS[distribution](n, Random(seed))
+            expected = sorted(data)
+            for name in algorithms:
+                f, limit = ALGORITHMS[name]
+                if n > limit:
+                    continue
+                result = f(data[:])
+                seconds = best_of(lambda: f(data[:]), repeat)
+                report.add(Measurement(name, distribution, n, seconds, result == expected))
+    report.fit()
+    return report
+
+
+def main(argv: list[str] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--algorithms', nargs='+', choices=ALGORITHMS, default=list(ALGORITHMS))
+    parser.add_argument('--distributions', nargs='+', choices=DISTRIBUTIONS, default=list(DISTRIBUTIONS))
+    parser.add_argument('--sizes', nargs='+', type=int, default=[250, 500, 1000, 2000, 10_000, 100_000])
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--output', help='save results as JSON')
+    args = parser.parse_args(argv)
+
+    report = run(args.algorithms, args.distributions, args.sizes, args.repeat, args.seed)
+    for m in report.measurements:
+        status = 'ok' if m.correct else 'WRONG'
+        print(f'{m.algorithm:>15} {m.distribution:>10} {m.size:>9} {m.seconds:12.6f}s {status}')
+    for algorithm, fits in report.fits.items():
+        for distribution, f in fits.items():
+            print(f'{algorithm:>15} {distribution:>10} {f["model"]:>11} slope={f["slope"]}')
+    if args.output:
+        report.save(args.output)
+    return 1 if report.failures else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
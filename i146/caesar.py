@@ -1,4 +1,21 @@
 #!/usr/bin/env python
+import math
+from collections.abc import Iterable
+
+ALPHABET = 'АБВГДЕЁЖЗИЙКЛМНОПРСТУФХЦЧШЩЪЫЬЭЮЯ'
+N = len(ALPHABET)
+
+# Частоты букв русского языка, %
+FREQUENCIES = {
+    'А': 8.01, 'Б': 1.59, 'В': 4.54, 'Г': 1.70, 'Д': 2.98, 'Е': 8.45, 'Ё': 0.04,
+    'Ж': 0.94, 'З': 1.65, 'И': 7.35, 'Й': 1.21, 'К': 3.49, 'Л': 4.40, 'М': 3.21,
+    'Н': 6.70, 'О': 10.97, 'П': 2.81, 'Р': 4.73, 'С': 5.47, 'Т': 6.26, 'У': 2.62,
+    'Ф': 0.26, 'Х': 0.97, 'Ц': 0.48, 'Ч': 1.44, 'Ш': 0.73, 'Щ': 0.36, 'Ъ': 0.04,
+    'Ы': 1.90, 'Ь': 1.74, 'Э': 0.32, 'Ю': 0.64, 'Я': 2.01,
+}
+LOG_FREQUENCIES = [math.log(FREQUENCIES[c] / 100) for c in ALPHABET]
+
+
 def caesar(s: str, k: int) -> str:
     """Шифр Цезаря — сдвиговый подстановочный шифр."""
 
@@ -36,6 +53,38 @@ def caesar(s: str, k: int) -> str:
     return ''.join(t)
 
 
+def histogram(s: str, counts: list[int] = None) -> list[int]:
+    """Количество каждой буквы алфавита в тексте без учёта регистра."""
+    counts = counts if counts is not None else [0] * N
+    s = s.upper()
+    for i, c in enumerate(ALPHABET):
+        counts[i] += s.count(c)
+    return counts
+
+
+def scores(counts: list[int]) -> list[float]:
+    """Логарифм правдоподобия каждого ключа: скалярное произведение гистограммы
+    на сдвинутые на ключ частоты языка."""
+    return [sum(n * LOG_FREQUENCIES[(i - k) % N] for i, n in enumerate(counts) if n)
+            for k in range(N)]
+
+
+def crack(s: str | Iterable[str]) -> list[tuple[int, float]]:
+    """Ключи шифра Цезаря по убыванию правдоподобия: caesar(s, -k) расшифровывает s.
+
+    Текст можно передать кусками, гистограмма считается за один проход."""
+    counts = [0] * N
+    for chunk in [s] if isinstance(s, str) else s:
+        histogram(chunk, counts)
+    return sorted(enumerate(scores(counts)), key=lambda ks: ks[1], reverse=True)
+
+
+def crack_file(path: str, encoding: str = 'utf-8', chunk_size: int = 1 << 20) -> list[tuple[int, float]]:
+    """crack() для файла любого размера, читаемого кусками по chunk_size символов."""
+    with open(path, 'r', encoding=encoding) as f:
+        return crack(iter(lambda: f.read(chunk_size), ''))
+
+
 if __name__ == '__main__':
     s1 = 'АБВГДЕЁЖЗИЙКЛМНОПРСТУФХЦЧШЩЪЫЬЭЮЯ'
     s2 = s1.lower()
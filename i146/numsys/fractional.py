@@ -0,0 +1,101 @@
+from fractions import Fraction
+from functools import cached_property
+from itertools import islice
+from typing import Callable, Iterator
+
+from i146.numsys.positional import Numeral, check_base, digits_to_string, int_to_string
+from i146.util import subscript
+
+
+def find_cycle(f: Callable[[int], int], x0: int) -> tuple[int, int]:
+    """Brent's cycle detection in O(1) memory: (start, length) of the cycle of x0, f(x0), ..."""
+    power = length = 1
+    tortoise, hare = x0, f(x0)
+    while tortoise != hare:
+        if power == length:
+            tortoise = hare
+            power *= 2
+            length = 0
+        hare = f(hare)
+        length += 1
+    tortoise = hare = x0
+    for _ in range(length):
+        hare = f(hare)
+    start = 0
+    while tortoise != hare:
+        tortoise, hare = f(tortoise), f(hare)
+        start += 1
+    return start, length
+
+
+class FractionalNumeral:
+    """A non-integer numeral in a positional system; fraction digits are produced lazily"""
+
+    def __init__(self, x: Fraction | int | str, base: int) -> None:
+        check_base(base)
+        self._value = Fraction(x)
+        self._base = base
+        self._negative = self._value < 0
+        integer, self._remainder = divmod(abs(self._value.numerator), self._value.denominator)
+        self._integer = integer
+
+    def __repr__(self) -> str:
+        cls = self.__class__.__name__
+        return f"{cls}('{self._value}', {self._base})"
+
+    def __str__(self) -> str:
+        start, length = self.period
+        digits = self.fraction_digits()
+        prefix = digits_to_string(islice(digits, start), self._base)
+        period = digits_to_string(islice(digits, length), self._base)
+        return self._format(prefix + (f'({period})' if period else ''))
+
+    def __eq__(self, other: 'FractionalNumeral') -> bool:
+        if isinstance(other, self.__class__):
+            return (self._value, self._base) == (other._value, other._base)
+        return NotImplemented
+
+    @property
+    def value(self) -> Fraction:
+        return self._value
+
+    @property
+    def base(self) -> int:
+        return self._base
+
+    @property
+    def integer(self) -> Numeral:
+        return Numeral(self._integer, self._base)
+
+    def _format(self, fraction: str) -> str:
+        sign = '-' if self._negative else ''
+        point = '.' if fraction else ''
+        return f'{sign}{int_to_string(self._integer, self._base)}{point}{fraction}{subscript(self._base)}'
+
+    def fraction_digits(self) -> Iterator[int]:
+        """Digits after the point; finite if the expansion terminates, infinite otherwise"""
+        r, q, base = self._remainder, self._value.denominator, self._base
+        while r:
+            d, r = divmod(r * base, q)
+            yield d
+
+    @cached_property
+    def period(self) -> tuple[int, int]:
+        """(number of digits before the period, period length); the length is 0 for finite expansions"""
+        base, q = self._base, self._value.denominator
+        step = lambda r: r * base % q
+        start, length = find_cycle(step, self._remainder)
+        r = self._remainder
+        for _ in range(start):
+            r = step(r)
+        return (start, 0) if r == 0 else (start, length)
+
+    def truncated(self, n: int) -> str:
+        """The first n digits after the point, with '…' if there are more"""
+        digits = self.fraction_digits()
+        head = digits_to_string(islice(digits, n), self._base)
+        more = next(digits, None) is not None
+        return self._format(head + ('…' if more else ''))
+
+    def convert(self, base: int) -> 'FractionalNumeral':
+        return self.__class__(self._value, base) if self._base != base else self
@@ -0,0 +1,86 @@
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from random import Random
+from typing import Hashable, Iterable, Mapping, Optional, Sequence, TypeVar
+
+from i146.numsys.positional import DIGITS, MAX_BASE, MIN_BASE
+from i146.numsys.problems import (
+    NumSysConvertionProblem,
+    NumSysMultiplicationProblem,
+    NumSysProblem,
+    NumSysProblemSet,
+)
+
+K = TypeVar('K', bound=Hashable)
+# Seeds accepted by random.Random
+Seed = int | str | bytes | None
+
+
+def random_numeral(rng: Random, base: int, length: int) -> str:
+    if length <= 1:
+        return DIGITS[rng.randrange(base)]
+    return DIGITS[rng.randrange(1, base)] + ''.join(rng.choices(DIGITS[:base], k=length - 1))
+
+
+@dataclass
+class NumSysProblemGenerator:
+    digits: tuple[int, int] = (3, 6)
+    bases: tuple[int, int] = (MIN_BASE, 16)
+    kinds: tuple[type[NumSysProblem], ...] = (NumSysConvertionProblem, NumSysMultiplicationProblem)
+
+    def __post_init__(self) -> None:
+        low, high = self.bases
+        if low < MIN_BASE or high > MAX_BASE or low > high:
+            raise ValueError(f'Invalid base range {self.bases}')
+        if low == high and NumSysConvertionProblem in self.kinds:
+            raise ValueError(f'Conversion problems need at least two bases, got {self.bases}')
+        if self.digits[0] < 1 or self.digits[0] > self.digits[1]:
+            raise ValueError(f'Invalid digit length range {self.digits}')
+
+    def _base(self, rng: Random) -> int:
+        return rng.randint(*self.bases)
+
+    def _numeral(self, rng: Random, base: int) -> str:
+        return random_numeral(rng, base, rng.randint(*self.digits))
+
+    def problem(self, rng: Random) -> NumSysProblem:
+        kind = rng.choice(self.kinds)
+        if kind is NumSysConvertionProblem:
+            base1 = self._base(rng)
+            base2 = self._base(rng)
+            while base2 == base1:
+                base2 = self._base(rng)
+            return NumSysConvertionProblem(self._numeral(rng, base1), base1, base2)
+        if kind is NumSysMultiplicationProblem:
+            base = self._base(rng)
+            return NumSysMultiplicationProblem(self._numeral(rng, base), self._numeral(rng, base), base)
+        raise TypeError(f"Cannot generate problems of type '{kind.__name__}'")
+
+    def problems(self, count: int, seed: Seed = None) -> NumSysProblemSet:
+        rng = Random(seed)
+        return NumSysProblemSet([self.problem(rng) for _ in range(count)])
+
+    def variants(self, count: int, students: Iterable[K], seed: Seed = 0) -> dict[K, NumSysProblemSet]:
+        """Per-student problem sets; each depends only on the seed and the student key."""
+        return {s: self.problems(count, f'{seed}/{s}') for s in students}
+
+
+def _answers(problem_set: NumSysProblemSet) -> list[str]:
+    return [p.answer for p in problem_set.problems]
+
+
+def solve(problem_sets: Iterable[NumSysProblemSet], processes: Optional[int] = None) -> list[list[str]]:
+    """Compute the answers of many problem sets in a process pool."""
+    problem_sets = list(problem_sets)
+    if processes == 1:
+        return [_answers(ps) for ps in problem_sets]
+    with ProcessPoolExecutor(processes) as pool:
+        return list(pool.map(_answers, problem_sets, chunksize=max(1, len(problem_sets) // 64)))
+
+
+def grade(
+    problem_sets: Mapping[K, NumSysProblemSet],
+    submissions: Mapping[K, Sequence[str]],
+) -> dict[K, list[bool]]:
+    """Grade submitted answers; missing submissions count as wrong."""
+    return {k: ps.grade(submissions.get(k, ())) for k, ps in problem_sets.items()}
@@ -1,8 +1,9 @@
 from dataclasses import dataclass, field
 from enum import StrEnum, unique
+from functools import cached_property
 from itertools import zip_longest
 from numbers import Integral
-from typing import Callable, Optional, TypeVar, Union
+from typing import Callable, Iterable, Optional, TypeVar, Union
 
 from i146.numsys.errors import (
     NumSysDifferentBasesError,
@@ -16,9 +17,6 @@ T = TypeVar('T')
 MIN_BASE = 2
 MAX_BASE = 36
 
-INDEX_0 = ord('0')
-INDEX_A = ord('A') - 10
-
 
 def add(*lists: list[int]) -> list[int] | map:
     return map(sum, zip_longest(*lists, fillvalue=0))
@@ -41,32 +39,97 @@ def mul(digits: list[int], factor: int, base: int, shift: int = 0) -> list[int]:
     return [0] * shift + adc(digits, 0, base, lambda digit: digit * factor)
 
 
+DIGITS = '0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZ'
+INVALID = 0xFF
+
+
+def _encode_table(base: int) -> bytes:
+    return bytes(ord(DIGITS[d]) if d < base else INVALID for d in range(256))
+
+
+def _decode_table(base: int) -> bytes:
+    table = bytearray([INVALID]) * 256
+    for d in range(base):
+        table[ord(DIGITS[d])] = d
+        table[ord(DIGITS[d].lower())] = d
+    return bytes(table)
+
+
+ENCODE = {base: _encode_table(base) for base in range(MIN_BASE, MAX_BASE + 1)}
+DECODE = {base: _decode_table(base) for base in range(MIN_BASE, MAX_BASE + 1)}
+ENCODE[None] = ENCODE[MAX_BASE]
+DECODE[None] = DECODE[MAX_BASE]
+
+
 def digit_to_string(digit: int, base: int = None) -> str:
     if base is not None and digit >= base:
         raise NumSysInvalidDigitError(digit, base)
-    if 0 <= digit <= 9:
-        index = INDEX_0
-    elif 10 <= digit < MAX_BASE:
-        index = INDEX_A
-    else:
-        raise NumSysInvalidDigitError(digit)
-    return chr(index + digit)
+    if 0 <= digit < MAX_BASE:
+        return DIGITS[digit]
+    raise NumSysInvalidDigitError(digit)
 
 
 def digit_from_string(digit: str, base: int = None) -> int:
     upper = digit[0].upper()
-    if '0' <= upper <= '9':
-        index = INDEX_0
-    elif 'A' <= upper <= 'Z':
-        index = INDEX_A
-    else:
+    value = DECODE[MAX_BASE][ord(upper)] if upper.isascii() else INVALID
+    if value == INVALID:
         raise NumSysInvalidDigitError(digit)
-    value = ord(upper) - index
     if base is not None and value >= base:
         raise NumSysInvalidDigitError(digit, base)
     return value
 
 
+def digits_to_string(digits: Iterable[int], base: int = None) -> str:
+    """Encode big-endian digits into a string in one pass."""
+    digits = digits if isinstance(digits, (bytes, bytearray)) else list(digits)
+    try:
+        s = bytes(digits).translate(ENCODE[base])
+    except ValueError:
+        s = None
+    if s is None or INVALID in s:
+        return ''.join([digit_to_string(digit, base) for digit in digits])
+    return s.decode('ascii')
+
+
+def digits_from_string(s: str, base: int = None) -> bytes:
+    """Decode a string into big-endian digits in one pass."""
+    try:
+        digits = s.encode('ascii').translate(DECODE[base])
+    except UnicodeEncodeError:
+        digits = None
+    if digits is None or INVALID in digits:
+        return bytes([digit_from_string(digit, base) for digit in s])
+    return digits
+
+
+FORMAT_SPECS = {2: 'b', 8: 'o', 10: 'd', 16: 'X'}
+
+
+def check_base(base: int) -> None:
+    if base > MAX_BASE or base < MIN_BASE:
+        raise NumSysInvalidBaseError(base)
+
+
+def int_to_digits(x: int, base: int) -> list[int]:
+    digits = []
+    while x:
+        x, digit = divmod(x, base)
+        digits.append(digit)
+    return digits
+
+
+def int_to_string(x: int, base: int) -> str:
+    check_base(base)
+    if base in FORMAT_SPECS:
+        return format(x, FORMAT_SPECS[base])
+    return digits_to_string(reversed(int_to_digits(x, base)), base) or '0'
+
+
+def string_to_int(s: str, base: int) -> int:
+    check_base(base)
+    return int(digits_from_string(s, base).translate(ENCODE[base]), base) if s else 0
+
+
 def default_abstract_methods(cls: T) -> T:
     base = cls.__bases__[0]
     for name in base.__abstractmethods__:
@@ -94,6 +157,7 @@ class Computation:
     a: 'Numeral'
     b: Union['Numeral', int]
     terms: Optional[list[Digits]] = field(default=None)
+    result: Optional['Numeral'] = field(default=None, init=False, repr=False, compare=False)
 
     def __str__(self) -> str:
         return f'{self.a} {self.operation} {self.b}'
@@ -101,27 +165,36 @@ class Computation:
     def has_solution(self) -> bool:
         return self.terms is not None
 
-    @property
+    @cached_property
+    def summands(self) -> Optional[list[tuple[str, str, int]]]:
+        """Rows between the rules of a worked solution: (sign, digits, shift)."""
+        if not self.has_solution():
+            return None
+        rows = []
+        for i, term in enumerate(self.terms):
+            if term:
+                sign = ArithmeticOperation.ADD if rows else ' '
+                rows.append((sign, digits_to_string(reversed(term[i:])), i))
+        return rows
+
+    @cached_property
     def solution(self) -> Optional[str]:
         if not self.has_solution():
             return None
         width = len(self.a.digits) + len(self.b.digits)
         base_width = len(subscript(self.a.base))
+        rule = line(width + base_width + 1)
         s = [
             f' {self.a!s:>{width + base_width}}',
             f'{self.operation}{self.b!s:>{width + base_width}}',
-            line(width + base_width + 1),
+            rule,
         ]
-        first = True
-        for i, term in enumerate(self.terms):
-            if term:
-                t = ''.join([digit_to_string(d) for d in reversed(term[i:])]) + ' ' * i
-                s.append(f'{" " if first else ArithmeticOperation.ADD}{t:>{width}}')
-                first = False
-        s.append(line(width + base_width + 1))
+        for sign, digits, shift in self.summands:
+            s.append(f'{sign}{digits + " " * shift:>{width}}')
+        s.append(rule)
         return '\n'.join(s)
 
-    @property
+    @cached_property
     def solution_width(self) -> Optional[int]:
         if not self.has_solution():
             return None
@@ -137,48 +210,30 @@ class Numeral(Integral):
         base: int,
         computation: Optional[Computation] = None,
     ) -> None:
-        if base > MAX_BASE or base < MIN_BASE:
-            raise NumSysInvalidBaseError(base)
+        check_base(base)
         if isinstance(x, int):
             self._decimal = x
-            self._digits = []
-            if not x:
-                self._string = '0'
+            if base in FORMAT_SPECS:
+                self._string = format(x, FORMAT_SPECS[base])
+                self._digits = list(reversed(digits_from_string(self._string, base))) if x else []
             else:
-                self._string = []
-                while x:
-                    x, digit = divmod(x, base)
-                    self._digits.append(digit)
-                    self._string.append(digit_to_string(digit, base))
-                self._string.reverse()
-                self._string = ''.join(self._string)
+                self._digits = int_to_digits(x, base)
+                self._string = digits_to_string(reversed(self._digits), base) or '0'
         elif isinstance(x, str):
-            self._decimal = 0
-            self._digits = []
-            if not x:
-                self._string = '0'
-            else:
-                self._string = x
-                for digit in x:
-                    digit = digit_from_string(digit, base)
-                    self._decimal = self._decimal * base + digit
-                    self._digits.append(digit)
-                self._digits.reverse()
+            digits = digits_from_string(x, base)
+            self._digits = list(reversed(digits))
+            self._decimal = int(digits.translate(ENCODE[base]), base) if x else 0
+            self._string = x or '0'
         elif isinstance(x, list):
-            self._decimal = 0
             self._digits = x
-            if not x:
-                self._string = '0'
-            else:
-                self._string = []
-                for digit in reversed(x):
-                    self._decimal = self._decimal * base + digit
-                    self._string.append(digit_to_string(digit, base))
-                self._string = ''.join(self._string)
+            self._string = digits_to_string(reversed(x), base) or '0'
+            self._decimal = int(self._string, base)
         else:
             raise TypeError(f"Invalid type '{type(x).__name__}' to construct a Numeral from")
         self._base: int = base
         self._computation = computation
+        if computation is not None:
+            computation.result = self
 
     def __repr__(self) -> str:
         cls = self.__class__.__name__
@@ -270,9 +325,9 @@ class Numeral(Integral):
     def computation(self) -> Optional[Computation]:
         return self._computation
 
-    @property
+    @cached_property
     def solution(self) -> Optional[str]:
-        if not self.has_computation() and not self.computation.has_solution():
+        if not self.has_computation() or not self.computation.has_solution():
             return None
         return f'{self.computation.solution}\n{self!s:>{self.computation.solution_width}}'
 
@@ -1,17 +1,96 @@
 import json
 from abc import ABCMeta, abstractmethod
-from dataclasses import dataclass
-from typing import List, Optional, Union
+from dataclasses import dataclass, fields
+from functools import cached_property
+from io import StringIO
+from itertools import zip_longest
+from typing import Any, ClassVar, Iterable, List, Optional, TextIO, TypeVar
 
-from mashumaro.mixins.json import DataClassJSONMixin
-from mashumaro.mixins.yaml import DataClassYAMLMixin
+from i146.numsys.positional import Computation, Numeral
+from i146.numsys.render import FORMATS
+from i146.util import WITHOUT_SUBSCRIPT, subscript
 
-from i146.numsys.positional import Numeral
-from i146.util import subscript
+
+S = TypeVar('S', bound='SerializableMixin')
+
+
+def normalize(answer: str) -> str:
+    return answer.translate(WITHOUT_SUBSCRIPT).strip().upper().lstrip('0') or '0'
+
+
+class SerializableMixin(metaclass=ABCMeta):
+    """JSON and YAML (de)serialization through to_dict/from_dict; PyYAML is imported on first use."""
+
+    @abstractmethod
+    def to_dict(self) -> dict[str, Any]:
+        pass
+
+    @classmethod
+    @abstractmethod
+    def from_dict(cls: type[S], d: dict[str, Any]) -> S:
+        pass
+
+    def to_json(self, **kwargs: Any) -> str:
+        return json.dumps(self.to_dict(), **kwargs)
+
+    @classmethod
+    def from_json(cls: type[S], data: str | bytes, **kwargs: Any) -> S:
+        return cls.from_dict(json.loads(data, **kwargs))
+
+    def to_yaml(self, **kwargs: Any) -> str:
+        import yaml
+        return yaml.dump(self.to_dict(), Dumper=getattr(yaml, 'CSafeDumper', yaml.SafeDumper), **kwargs)
+
+    @classmethod
+    def from_yaml(cls: type[S], data: str | bytes) -> S:
+        import yaml
+        return cls.from_dict(yaml.load(data, Loader=getattr(yaml, 'CSafeLoader', yaml.SafeLoader)))
 
 
 @dataclass
-class NumSysProblem(DataClassJSONMixin, DataClassYAMLMixin, metaclass=ABCMeta):
+class NumSysProblem(SerializableMixin, metaclass=ABCMeta):
+    TYPE: ClassVar[str]
+    TYPES: ClassVar[dict[str, type['NumSysProblem']]] = {}
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        if 'TYPE' in cls.__dict__:
+            NumSysProblem.TYPES[cls.TYPE] = cls
+
+    @classmethod
+    def tag(cls, record: dict[str, Any]) -> str:
+        """Discriminator of a record, inferred from its keys for untagged records."""
+        if 'type' in record:
+            return record['type']
+        keys = record.keys() - {'answer'}
+        for tag, problem in cls.TYPES.items():
+            if keys == {f.name for f in fields(problem)}:
+                return tag
+        raise ValueError(f'Unknown problem record {record!r}')
+
+    def to_record(self, answer: bool = False) -> dict[str, Any]:
+        record = {'type': self.TYPE}
+        for f in fields(self):
+            record[f.name] = getattr(self, f.name)
+        if answer:
+            record['answer'] = self.answer
+        return record
+
+    @classmethod
+    def from_record(cls, record: dict[str, Any]) -> 'NumSysProblem':
+        problem = cls.TYPES[cls.tag(record)]
+        self = problem(**{f.name: record[f.name] for f in fields(problem)})
+        if 'answer' in record:
+            self.__dict__['answer'] = record['answer']
+        return self
+
+    def to_dict(self) -> dict[str, Any]:
+        return self.to_record()
+
+    @classmethod
+    def from_dict(cls, d: dict[str, Any]) -> 'NumSysProblem':
+        return cls.from_record(d)
+
     @abstractmethod
     def __str__(self) -> str:
         pass
@@ -23,6 +102,10 @@ class NumSysProblem(DataClassJSONMixin, DataClassYAMLMixin, metaclass=ABCMeta):
     def solution(self) -> Optional[str]:
         return None
 
+    @property
+    def computation(self) -> Optional[Computation]:
+        return None
+
     @property
     @abstractmethod
     def answer(self) -> str:
@@ -32,21 +115,30 @@ class NumSysProblem(DataClassJSONMixin, DataClassYAMLMixin, metaclass=ABCMeta):
     def with_answer(self) -> str:
         pass
 
+    def check(self, answer: str) -> bool:
+        return normalize(answer) == normalize(self.answer)
+
 
 @dataclass
 class NumSysConvertionProblem(NumSysProblem):
+    TYPE: ClassVar[str] = 'convert'
+
     a: str
     base1: int
     base2: int
 
-    def __post_init__(self) -> None:
-        self._a = Numeral(self.a, self.base1)
-        self._b = self._a.convert(self.base2)
+    @cached_property
+    def _a(self) -> Numeral:
+        return Numeral(self.a, self.base1)
+
+    @cached_property
+    def _b(self) -> Numeral:
+        return self._a.convert(self.base2)
 
     def __str__(self) -> str:
         return f'{self._a} = ?{subscript(self._b.base)}'
 
-    @property
+    @cached_property
     def answer(self) -> str:
         return str(self._b)
 
@@ -56,12 +148,15 @@ class NumSysConvertionProblem(NumSysProblem):
 
 @dataclass
 class NumSysMultiplicationProblem(NumSysProblem):
+    TYPE: ClassVar[str] = 'mul'
+
     a: str
     b: str
     base: int
 
-    def __post_init__(self) -> None:
-        self._numeral = Numeral(self.a, self.base) * Numeral(self.b, self.base)
+    @cached_property
+    def _numeral(self) -> Numeral:
+        return Numeral(self.a, self.base) * Numeral(self.b, self.base)
 
     def __str__(self) -> str:
         return str(self._numeral.computation)
@@ -74,6 +169,10 @@ class NumSysMultiplicationProblem(NumSysProblem):
         return self._numeral.solution
 
     @property
+    def computation(self) -> Computation:
+        return self._numeral.computation
+
+    @cached_property
     def answer(self) -> str:
         return str(self._numeral)
 
@@ -82,17 +181,27 @@ class NumSysMultiplicationProblem(NumSysProblem):
 
 
 @dataclass
-class NumSysProblemSet(DataClassJSONMixin, DataClassYAMLMixin):
-    problems: List[Union[*NumSysProblem.__subclasses__()]]
+class NumSysProblemSet(SerializableMixin):
+    problems: List[NumSysProblem]
+
+    def to_dict(self) -> dict[str, Any]:
+        return {'problems': [p.to_record() for p in self.problems]}
+
+    @classmethod
+    def from_dict(cls, d: dict[str, Any]) -> 'NumSysProblemSet':
+        return cls([NumSysProblem.from_record(p) for p in d['problems']])
 
     def __str__(self) -> str:
         return '\n'.join([f'{i}) {p}' for i, p in enumerate(self.problems, start=1)])
 
     def answers(self) -> str:
-        s = []
-        for i, p in enumerate(self.problems, start=1):
-            line = f'{i}) {p.with_answer()}'
-            if p.has_solution():
-                line += '\n' + p.solution
-            s.append(line)
-        return '\n\n'.join(s)
\ No newline at end of file
+        f = StringIO()
+        self.write_answers(f)
+        return f.getvalue()
+
+    def write_answers(self, f: TextIO, format: str = 'text') -> None:
+        FORMATS[format](self.problems, f)
+
+    def grade(self, answers: Iterable[str]) -> list[bool]:
+        return [a is not None and p.check(a)
+                for p, a in zip_longest(self.problems, answers) if p is not None]
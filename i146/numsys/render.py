@@ -0,0 +1,115 @@
+"""Answer sheet rendering for numeral system problems.
+
+Renderers write straight into a text stream, so sheets for thousands of
+problems are produced without building intermediate strings.
+"""
+import re
+from html import escape
+from typing import Callable, Iterable, Protocol, TextIO
+
+from i146.numsys.positional import ArithmeticOperation, Computation, Numeral
+from i146.util import FROM_SUBSCRIPT, SUBSCRIPT_DIGITS
+
+SUBSCRIPT = re.compile(f'[{SUBSCRIPT_DIGITS}]+')
+
+PHANTOM_DIGIT = r'\phantom{0}'
+LATEX_OPERATIONS = {
+    ArithmeticOperation.ADD: '+',
+    ArithmeticOperation.SUB: '-',
+    ArithmeticOperation.MUL: r'\times',
+    ArithmeticOperation.DIV: r'\div',
+}
+
+
+class Problem(Protocol):
+    def has_solution(self) -> bool: ...
+
+    def with_answer(self) -> str: ...
+
+    @property
+    def solution(self) -> str | None: ...
+
+    @property
+    def computation(self) -> Computation | None: ...
+
+
+def write_text(problems: Iterable[Problem], f: TextIO) -> None:
+    for i, p in enumerate(problems, start=1):
+        if i > 1:
+            f.write('\n\n')
+        f.write(f'{i}) {p.with_answer()}')
+        if p.has_solution():
+            f.write('\n')
+            f.write(p.solution)
+
+
+def _latex_subscripts(s: str) -> str:
+    return SUBSCRIPT.sub(lambda m: f'_{{{m[0].translate(FROM_SUBSCRIPT)}}}', s)
+
+
+def latex_inline(s: str) -> str:
+    s = _latex_subscripts(s)
+    for operation, command in LATEX_OPERATIONS.items():
+        s = s.replace(operation, command)
+    return f'${s}$'
+
+
+def _latex_numeral(x: Numeral) -> str:
+    return _latex_subscripts(str(x))
+
+
+def write_latex_solution(c: Computation, f: TextIO) -> None:
+    f.write('\\[\n\\begin{array}{@{}c@{\\,}r@{}}\n')
+    f.write(f' & {_latex_numeral(c.a)} \\\\\n')
+    f.write(f'{LATEX_OPERATIONS[c.operation]} & {_latex_numeral(c.b)} \\\\\n\\hline\n')
+    for sign, digits, shift in c.summands:
+        f.write(f'{sign.strip()} & {digits}{PHANTOM_DIGIT * shift} \\\\\n')
+    f.write(f'\\hline\n & {_latex_numeral(c.result)}\n\\end{{array}}\n\\]\n')
+
+
+def write_latex(problems: Iterable[Problem], f: TextIO) -> None:
+    f.write('\\begin{enumerate}\n')
+    for p in problems:
+        f.write(f'\\item {latex_inline(p.with_answer())}\n')
+        if p.has_solution():
+            write_latex_solution(p.computation, f)
+    f.write('\\end{enumerate}\n')
+
+
+def html_inline(s: str) -> str:
+    return SUBSCRIPT.sub(lambda m: f'<sub>{m[0].translate(FROM_SUBSCRIPT)}</sub>', escape(s))
+
+
+def _html_row(sign: str, value: str) -> str:
+    return f'<tr><td>{escape(sign.strip())}</td><td>{value}</td></tr>\n'
+
+
+def write_html_solution(c: Computation, f: TextIO) -> None:
+    rule = '<tr><td colspan="2"><hr></td></tr>\n'
+    f.write('<table class="numsys-solution" style="text-align: right; white-space: pre; '
+            'font-family: monospace">\n')
+    f.write(_html_row('', html_inline(str(c.a))))
+    f.write(_html_row(c.operation, html_inline(str(c.b))))
+    f.write(rule)
+    for sign, digits, shift in c.summands:
+        f.write(_html_row(sign, digits + ' ' * shift))
+    f.write(rule)
+    f.write(_html_row('', html_inline(str(c.result))))
+    f.write('</table>\n')
+
+
+def write_html(problems: Iterable[Problem], f: TextIO) -> None:
+    f.write('<ol class="numsys-answers">\n')
+    for p in problems:
+        f.write(f'<li>{html_inline(p.with_answer())}\n')
+        if p.has_solution():
+            write_html_solution(p.computation, f)
+        f.write('</li>\n')
+    f.write('</ol>\n')
+
+
+FORMATS: dict[str, Callable[[Iterable[Problem], TextIO], None]] = {
+    'text': write_text,
+    'latex': write_latex,
+    'html': write_html,
+}
@@ -0,0 +1,47 @@
+"""Streaming JSON Lines (de)serialization of numeral system problems.
+
+Each line is one tagged problem record, see `NumSysProblem.to_record`.
+orjson is used when installed, the standard json module otherwise.
+"""
+from pathlib import Path
+from typing import IO, Any, Iterable, Iterator
+
+from i146.numsys.problems import NumSysProblem, NumSysProblemSet
+
+try:
+    import orjson
+
+    def dumps(obj: Any) -> bytes:
+        return orjson.dumps(obj)
+
+    loads = orjson.loads
+except ImportError:
+    import json
+
+    def dumps(obj: Any) -> bytes:
+        return json.dumps(obj, ensure_ascii=False, separators=(',', ':')).encode()
+
+    loads = json.loads
+
+
+def write(problems: Iterable[NumSysProblem], f: IO[bytes], answers: bool = False) -> int:
+    n = 0
+    for n, p in enumerate(problems, start=1):
+        f.write(dumps(p.to_record(answers)) + b'\n')
+    return n
+
+
+def read(f: Iterable[bytes]) -> Iterator[NumSysProblem]:
+    for line in f:
+        if line.strip():
+            yield NumSysProblem.from_record(loads(line))
+
+
+def dump(problem_set: NumSysProblemSet, path: str | Path, answers: bool = False) -> int:
+    with open(path, 'wb') as f:
+        return write(problem_set.problems, f, answers)
+
+
+def load(path: str | Path) -> NumSysProblemSet:
+    with open(path, 'rb') as f:
+        return NumSysProblemSet(list(read(f)))
@@ -1,35 +1,20 @@
 #!/usr/bin/env python
-"""Перевод чисел в разные системы счисления"""
-from dataclasses import dataclass, field
+"""Перевод чисел в разные системы счисления
 
+Совместимый интерфейс поверх i146.numsys.positional.
+"""
+from dataclasses import dataclass, field
 
-def sub(x: int) -> str:
-    return ''.join([chr(ord(d) - ord('0') + 0x2080) for d in str(x)])
+from i146.numsys.positional import int_to_string, string_to_int
+from i146.util import subscript as sub
 
 
 def dec(x: str, base: int) -> int:
-    assert base <= 36, 'The base must be less than or equal to 36'
-    dec = 0
-    for digit in x.upper():
-        if '0' <= digit <= '9':
-            digit = ord(digit) - ord('0')
-        elif 'A' <= digit <= 'Z':
-            digit = ord(digit) - ord('A') + 10
-        assert 0 <= digit < base, f'A digit ({digit}) must be less than the base ({base})'
-        dec = dec * base + digit
-    return dec
+    return string_to_int(x, base)
 
 
 def num(dec: int, base: int) -> str:
-    x = []
-    while dec:
-        dec, digit = divmod(dec, base)
-        if digit >= 10:
-            digit = chr(digit + ord('A') - 10)
-        else:
-            digit = chr(digit + ord('0'))
-        x.append(digit)
-    return ''.join(reversed(x))
+    return int_to_string(dec, base)
 
 
 @dataclass
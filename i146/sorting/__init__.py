@@ -0,0 +1,308 @@
+"""Алгоритмы сортировки"""
+import heapq
+from importlib import import_module
+from typing import Any, Callable, Iterable
+
+# Подмодули с тяжёлыми зависимостями (NumPy, multiprocessing) импортируются при первом обращении
+LAZY = {
+    'argsort': 'radix',
+    'counting_sort': 'radix',
+    'integer_sort': 'radix',
+    'radix_sort': 'radix',
+    'parallel_sort': 'parallel',
+    'external_sort': 'external',
+    'sort_lines': 'external',
+    'sort_records': 'external',
+}
+
+
+def __getattr__(name: str) -> Any:
+    if name in LAZY:
+        return getattr(import_module(f'{__name__}.{LAZY[name]}'), name)
+    raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
+
+
+def bubble_sort(a: list) -> list:
+    """Сортировка пузырьком
+    - Устойчивая
+    - Время: O(n²)
+    - Память: O(1)
+    """
+    n = len(a)
+    for i in range(n - 1):
+        swapped = False
+        for j in range(n - i - 1):
+            if a[j] > a[j + 1]:
+                a[j], a[j + 1] = a[j + 1], a[j]
+                swapped = True
+        if not swapped:
+            return a
+    return a
+
+
+def selection_sort(a: list) -> list:
+    """Сортировка выбором
+    - Неустойчивая
+    - Время: O(n²)
+    - Память: O(1)
+    """
+    n = len(a)
+    for i in range(n):
+        min_index = i
+        for j in range(i + 1, n):
+            if a[j] < a[min_index]:
+                min_index = j
+        a[i], a[min_index] = a[min_index], a[i]
+    return a
+
+
+def insertion_sort(a: list) -> list:
+    """Сортировка вставками
+    - Устойчивая
+    - Время: O(n²)
+    - Память: O(1)
+    """
+    n = len(a)
+    for i in range(1, n):
+        x = a[i]
+        j = i - 1
+        while j >= 0 and x < a[j]:
+            a[j + 1] = a[j]
+            j -= 1
+        a[j + 1] = x
+    return a
+
+
+INSERTION_SORT_CUTOFF = 16
+NINTHER_CUTOFF = 128
+# До какой доли n выбор k элементов кучей быстрее полной сортировки
+HEAP_SELECT_RATIO = 8
+
+
+def _insertion_sort(a: list, low: int, high: int) -> None:
+    for i in range(low + 1, high + 1):
+        x = a[i]
+        j = i - 1
+        while j >= low and x < a[j]:
+            a[j + 1] = a[j]
+            j -= 1
+        a[j + 1] = x
+
+
+def _sift_down(a: list, low: int, root: int, n: int) -> None:
+    x = a[low + root]
+    while (child := 2 * root + 1) < n:
+        if child + 1 < n and a[low + child] < a[low + child + 1]:
+            child += 1
+        if not x < a[low + child]:
+            break
+        a[low + root] = a[low + child]
+        root = child
+    a[low + root] = x
+
+
+def _heapsort(a: list, low: int, high: int) -> None:
+    n = high - low + 1
+    for root in range(n // 2 - 1, -1, -1):
+        _sift_down(a, low, root, n)
+    for end in range(n - 1, 0, -1):
+        a[low], a[low + end] = a[low + end], a[low]
+        _sift_down(a, low, 0, end)
+
+
+def _median_of_three(a: list, i: int, j: int, k: int) -> int:
+    x, y, z = a[i], a[j], a[k]
+    if x < y:
+        if y < z:
+            return j
+        return k if x < z else i
+    if x < z:
+        return i
+    return k if y < z else j
+
+
+def _pivot(a: list, low: int, high: int) -> int:
+    mid = (low + high) // 2
+    if high - low < NINTHER_CUTOFF:
+        return _median_of_three(a, low, mid, high)
+    step = (high - low) // 8
+    return _median_of_three(
+        a,
+        _median_of_three(a, low, low + step, low + 2 * step),
+        _median_of_three(a, mid - step, mid, mid + step),
+        _median_of_three(a, high - 2 * step, high - step, high),
+    )
+
+
+def _partition3(a: list, low: int, high: int, pivot) -> tuple[int, int]:
+    """Разбиение Дейкстры: a[low:lt] < pivot, a[lt:gt+1] == pivot, a[gt+1:high+1] > pivot"""
+    lt, i, gt = low, low, high
+    while i <= gt:
+        x = a[i]
+        if x < pivot:
+            a[lt], a[i] = x, a[lt]
+            lt += 1
+            i += 1
+        elif pivot < x:
+            a[gt], a[i] = x, a[gt]
+            gt -= 1
+        else:
+            i += 1
+    return lt, gt
+
+
+def _introsort(a: list, low: int, high: int) -> None:
+    stack = [(low, high, 2 * (high - low + 1).bit_length())]
+    while stack:
+        low, high, depth = stack.pop()
+        while high - low >= INSERTION_SORT_CUTOFF:
+            if not depth:
+                _heapsort(a, low, high)
+                break
+            depth -= 1
+            lt, gt = _partition3(a, low, high, a[_pivot(a, low, high)])
+            if lt - low < high - gt:
+                stack.append((gt + 1, high, depth))
+                high = lt - 1
+            else:
+                stack.append((low, lt - 1, depth))
+                low = gt + 1
+        else:
+            _insertion_sort(a, low, high)
+
+
+def quickSort(
+    a: list,
+    low: int = None,
+    high: int = None,
+    *,
+    key: Callable[[Any], Any] = None,
+    reverse: bool = False,
+) -> list:
+    """Быстрая сортировка (интроспективная)
+    - Неустойчивая; устойчивая, если задан key
+    - Время: O(n log n) в худшем случае
+    - Память: O(log n), O(n) с key
+    - Опорный элемент: медиана трёх (девяти), трёхпутевое разбиение,
+      вставки для коротких отрезков, пирамидальная сортировка
+      при слишком глубоком разбиении; без рекурсии
+    """
+    if low is None:
+        low = 0
+    if high is None:
+        high = len(a) - 1
+    if low >= high:
+        return a
+    if key is None:
+        _introsort(a, low, high)
+        if reverse:
+            a[low:high + 1] = a[high:low - 1 if low else None:-1]
+        return a
+    items = a[low:high + 1]
+    sign = -1 if reverse else 1
+    decorated = [(key(x), sign * i) for i, x in enumerate(items)]
+    _introsort(decorated, 0, len(decorated) - 1)
+    if reverse:
+        decorated.reverse()
+    a[low:high + 1] = [items[abs(i)] for _, i in decorated]
+    return a
+
+
+def _median_of_medians(a: list, low: int, high: int) -> Any:
+    medians = []
+    for i in range(low, high + 1, 5):
+        group = sorted(a[i:min(i + 5, high + 1)])
+        medians.append(group[(len(group) - 1) // 2])
+    mid = (len(medians) - 1) // 2
+    _introselect(medians, mid, 0, len(medians) - 1)
+    return medians[mid]
+
+
+def _introselect(a: list, k: int, low: int, high: int) -> None:
+    # Если за два разбиения отрезок не сократился вдвое, следующие два
+    # опорных элемента — медианы медиан: так общее время остаётся O(n)
+    size, partitions, slow = high - low + 1, 0, False
+    while high - low >= INSERTION_SORT_CUTOFF:
+        pivot = _median_of_medians(a, low, high) if slow else a[_pivot(a, low, high)]
+        lt, gt = _partition3(a, low, high, pivot)
+        if k < lt:
+            high = lt - 1
+        elif k > gt:
+            low = gt + 1
+        else:
+            return
+        partitions += 1
+        if partitions == 2:
+            slow = 2 * (high - low + 1) > size
+            size, partitions = high - low + 1, 0
+    _insertion_sort(a, low, high)
+
+
+def select(a: list, k: int, key: Callable[[Any], Any] = None) -> Any:
+    """Выбор k-го по порядку элемента (интроспективный quickselect)
+    - Переставляет a так, что a[k] на своём месте, слева не больше, справа не меньше
+    - Время: O(n) в среднем, O(n) в худшем случае (медиана медиан)
+    - Память: O(1), O(n) с key
+    """
+    n = len(a)
+    if k < 0:
+        k += n
+    if not 0 <= k < n:
+        raise IndexError('selection index out of range')
+    if key is None:
+        _introselect(a, k, 0, n - 1)
+        return a[k]
+    decorated = [(key(x), i) for i, x in enumerate(a)]
+    _introselect(decorated, k, 0, n - 1)
+    a[:] = [a[i] for _, i in decorated]
+    return a[k]
+
+
+def partial_sort(a: list, k: int, key: Callable[[Any], Any] = None, reverse: bool = False) -> list:
+    """Частичная сортировка: первые k элементов a — k наименьших (наибольших) по порядку
+    - Устойчивая, если задан key
+    - Время: O(n + k log k)
+    - Память: O(log k), O(n) с key
+    """
+    n = len(a)
+    k = max(0, min(k, n))
+    if not k:
+        return a
+    items = a if key is None else [(key(x), -i if reverse else i) for i, x in enumerate(a)]
+    if reverse:
+        m = n - k
+        if m:
+            _introselect(items, m, 0, n - 1)
+        head = items[m:]
+        _introsort(head, 0, k - 1)
+        head.reverse()
+        items[:] = head + items[:m]
+    else:
+        if k < n:
+            _introselect(items, k - 1, 0, n - 1)
+        _introsort(items, 0, k - 1)
+    if key is not None:
+        a[:] = [a[abs(i)] for _, i in items]
+    return a
+
+
+def nsmallest(a: Iterable, k: int, key: Callable[[Any], Any] = None) -> list:
+    """k наименьших элементов по порядку
+    - Устойчивая
+    - Время: O(n log k) кучей, O(k) памяти; для списка при k > n / HEAP_SELECT_RATIO
+      быстрее полная сортировка (sorted)
+    """
+    if isinstance(a, list) and k * HEAP_SELECT_RATIO > len(a):
+        return sorted(a, key=key)[:k]
+    return heapq.nsmallest(k, a, key)
+
+
+def nlargest(a: Iterable, k: int, key: Callable[[Any], Any] = None) -> list:
+    """k наибольших элементов по убыванию
+    - Устойчивая
+    - Время: O(n log k) кучей, O(k) памяти; для списка при k > n / HEAP_SELECT_RATIO
+      быстрее полная сортировка (sorted)
+    """
+    if isinstance(a, list) and k * HEAP_SELECT_RATIO > len(a):
+        return sorted(a, key=key, reverse=True)[:k]
+    return heapq.nlargest(k, a, key)
@@ -0,0 +1,148 @@
+"""Внешняя сортировка слиянием для данных, не помещающихся в память
+
+Вход читается отрезками в пределах бюджета памяти, каждый отрезок
+сортируется и сбрасывается во временный файл, затем отрезки сливаются
+кучей (heapq.merge) с буферизованным чтением. Как и sorted(), сортировка
+устойчива, в том числе при reverse=True.
+"""
+import os
+import sys
+from functools import partial
+from heapq import merge
+from pathlib import Path
+from tempfile import TemporaryDirectory, mkstemp
+from typing import IO, Any, Callable, Iterable, Iterator
+
+DEFAULT_MEMORY = 64 << 20
+BUFFER_SIZE = 1 << 20
+
+Reader = Callable[[IO[bytes]], Iterator[bytes]]
+
+
+def lines(f: IO[bytes]) -> Iterator[bytes]:
+    for line in f:
+        yield line if line.endswith(b'\n') else line + b'\n'
+
+
+def _line_key(line: bytes) -> bytes:
+    # Строки сравниваются без перевода строки, как в sorted(): иначе b'a\tb\n' < b'a\n'
+    return line.rstrip(b'\r\n')
+
+
+def records(size: int) -> Reader:
+    def read(f: IO[bytes]) -> Iterator[bytes]:
+        for record in iter(partial(f.read, size), b''):
+            if len(record) != size:
+                raise ValueError(f'Truncated record: {len(record)} of {size} bytes')
+            yield record
+    return read
+
+
+def _write_run(items: Iterable[bytes], tmpdir: str) -> Path:
+    fd, path = mkstemp(dir=tmpdir, suffix='.run')
+    with open(fd, 'wb', buffering=BUFFER_SIZE) as f:
+        f.writelines(items)
+    return Path(path)
+
+
+def _read_run(path: Path, reader: Reader) -> Iterator[bytes]:
+    try:
+        with path.open('rb', buffering=BUFFER_SIZE) as f:
+            yield from reader(f)
+    finally:
+        path.unlink(missing_ok=True)
+
+
+def external_sort(
+    items: Iterable[bytes],
+    reader: Reader = lines,
+    key: Callable[[bytes], Any] = None,
+    reverse: bool = False,
+    memory: int = DEFAULT_MEMORY,
+    tmpdir: str | Path = None,
+) -> Iterator[bytes]:
+    """Внешняя сортировка слиянием
+    - Устойчивая
+    - Время: O(n log n), O(log_k r) проходов слияния по r отрезкам
+    - Память: O(memory)
+    Элементы — байтовые строки в том виде, в котором их читает reader.
+    """
+    if key is None and reader is lines:
+        key = _line_key
+    fan_in = max(2, memory // (2 * BUFFER_SIZE))
+    with TemporaryDirectory(dir=tmpdir, prefix='i146-sort-') as directory:
+        runs: list[Path] = []
+        run, size = [], 0
+        for item in items:
+            run.append(item)
+            size += sys.getsizeof(item) + 8
+            if size >= memory:
+                run.sort(key=key, reverse=reverse)
+                runs.append(_write_run(run, directory))
+                run, size = [], 0
+        run.sort(key=key, reverse=reverse)
+        if not runs:
+            yield from run
+            return
+        if run:
+            runs.append(_write_run(run, directory))
+        del run
+        while len(runs) > fan_in:
+            runs = [_write_run(merge(*(_read_run(p, reader) for p in runs[i:i + fan_in]),
+                                     key=key, reverse=reverse), directory)
+                    for i in range(0, len(runs), fan_in)]
+        yield from merge(*(_read_run(p, reader) for p in runs), key=key, reverse=reverse)
+
+
+def _sort_file(
+    src: str | Path,
+    dst: str | Path,
+    reader: Reader,
+    key: Callable[[bytes], Any],
+    reverse: bool,
+    memory: int,
+    tmpdir: str | Path,
+) -> None:
+    # Результат пишется во временный файл рядом с dst и подменяет его целиком:
+    # src и dst могут совпадать, а external_sort читает src лениво
+    dst = Path(dst)
+    fd, tmp = mkstemp(dir=dst.parent, prefix=f'.{dst.name}.', suffix='.tmp')
+    try:
+        with open(src, 'rb', buffering=BUFFER_SIZE) as f, open(fd, 'wb', buffering=BUFFER_SIZE) as out:
+            out.writelines(external_sort(reader(f), reader, key, reverse, memory, tmpdir))
+        os.replace(tmp, dst)
+    except BaseException:
+        Path(tmp).unlink(missing_ok=True)
+        raise
+
+
+def sort_lines(
+    src: str | Path,
+    dst: str | Path,
+    key: Callable[[str], Any] = None,
+    reverse: bool = False,
+    memory: int = DEFAULT_MEMORY,
+    encoding: str = 'utf-8',
+    tmpdir: str | Path = None,
+) -> None:
+    """Сортировка строк текстового файла; строки (и аргумент key) — без перевода строки
+
+    src и dst могут совпадать.
+    """
+    def decoded(line: bytes) -> Any:
+        return key(line.decode(encoding).rstrip('\r\n'))
+
+    _sort_file(src, dst, lines, decoded if key is not None else None, reverse, memory, tmpdir)
+
+
+def sort_records(
+    src: str | Path,
+    dst: str | Path,
+    size: int,
+    key: Callable[[bytes], Any] = None,
+    reverse: bool = False,
+    memory: int = DEFAULT_MEMORY,
+    tmpdir: str | Path = None,
+) -> None:
+    """Сортировка файла из записей фиксированной длины size байт"""
+    _sort_file(src, dst, records(size), key, reverse, memory, tmpdir)
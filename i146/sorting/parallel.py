@@ -0,0 +1,198 @@
+"""Параллельная сортировка слиянием на пуле процессов
+
+Данные копируются в разделяемую память (multiprocessing.shared_memory)
+один раз; процессы сортируют свои куски и сливают их на месте, без
+сериализации массивов между процессами.
+"""
+from array import array
+from bisect import bisect_left, bisect_right
+from concurrent.futures import ProcessPoolExecutor
+from heapq import merge
+from multiprocessing.shared_memory import SharedMemory
+from os import cpu_count
+from typing import Any, MutableSequence, Sequence
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# Короткие массивы выгоднее сортировать в одном процессе
+PARALLEL_SORT_CUTOFF = 1 << 16
+# Число выборок из каждого отсортированного куска для выбора разделителей
+OVERSAMPLING = 32
+TYPECODES = 'bBhHiIlLqQfd'
+
+
+def _typecode(a: Sequence) -> str:
+    if isinstance(a, array):
+        typecode = a.typecode
+    elif np is not None and isinstance(a, np.ndarray):
+        typecode = a.dtype.char
+    else:
+        # Список копируется в разделяемую память только без изменения значений:
+        # все int в пределах 64 бит или все float
+        types = set(map(type, a))
+        if types == {int} and -1 << 63 <= min(a) and max(a) < 1 << 63:
+            typecode = 'q'
+        elif types == {float}:
+            typecode = 'd'
+        else:
+            names = ', '.join(sorted(t.__name__ for t in types))
+            raise TypeError(f'Cannot sort a list of {names} in shared memory without changing values')
+    if typecode not in TYPECODES or (np is not None and isinstance(a, np.ndarray) and a.ndim != 1):
+        raise TypeError(f'Cannot sort {type(a).__name__} of {typecode!r} in shared memory')
+    return typecode
+
+
+def _bounds(n: int, parts: int) -> list[int]:
+    return [n * i // parts for i in range(parts + 1)]
+
+
+class _Buffer:
+    """Одномерный числовой массив поверх блока разделяемой памяти"""
+
+    def __init__(self, name: str, typecode: str, n: int) -> None:
+        self.shm = SharedMemory(name)
+        if np is not None:
+            self.view = np.ndarray((n,), np.dtype(typecode), buffer=self.shm.buf)
+        else:
+            self.view = self.shm.buf.cast(typecode)
+
+    def close(self) -> None:
+        if isinstance(self.view, memoryview):
+            self.view.release()
+        del self.view
+        self.shm.close()
+
+    def __enter__(self) -> Any:
+        return self.view
+
+    def __exit__(self, *args: Any) -> None:
+        self.close()
+
+
+def _sort_run(name: str, typecode: str, n: int, start: int, stop: int) -> None:
+    with _Buffer(name, typecode, n) as data:
+        if np is not None:
+            data[start:stop].sort()
+        else:
+            data[start:stop] = array(typecode, sorted(data[start:stop]))
+
+
+def _merge_runs(
+    name: str,
+    out: str,
+    typecode: str,
+    n: int,
+    runs: list[tuple[int, int]],
+    offset: int,
+) -> None:
+    size = sum(stop - start for start, stop in runs)
+    with _Buffer(name, typecode, n) as data, _Buffer(out, typecode, n) as result:
+        if np is not None:
+            merged = np.concatenate([data[start:stop] for start, stop in runs])
+            merged.sort(kind='stable')
+            result[offset:offset + size] = merged
+        else:
+            result[offset:offset + size] = array(typecode, merge(*(data[start:stop] for start, stop in runs)))
+
+
+def _splitters(data: Any, bounds: list[int], parts: int) -> list:
+    samples = []
+    for start, stop in zip(bounds, bounds[1:]):
+        step = max((stop - start) // OVERSAMPLING, 1)
+        samples.extend(data[i] for i in range(start, stop, step))
+    samples.sort()
+    return [samples[len(samples) * i // parts] for i in range(1, parts)]
+
+
+def _cut(data: Any, start: int, stop: int, x: Any, side: str = 'left') -> int:
+    if np is not None:
+        return start + int(np.searchsorted(data[start:stop], x, side))
+    return (bisect_left if side == 'left' else bisect_right)(data, x, start, stop)
+
+
+def _cuts(data: Any, bounds: list[int], splitters: list) -> list[list[int]]:
+    """Границы частей в каждом куске: по разделителю j слева остаётся около n·j/p элементов
+
+    Равные разделителю элементы делятся между соседними частями по рангу,
+    иначе при малом числе различных значений почти всё попадает в одну часть.
+    """
+    runs = list(zip(bounds, bounds[1:]))
+    cuts = [[start] for start, _ in runs]
+    parts = len(splitters) + 1
+    for j, x in enumerate(splitters, start=1):
+        low = [_cut(data, start, stop, x) for start, stop in runs]
+        high = [_cut(data, start, stop, x, 'right') for start, stop in runs]
+        # Сколько равных x элементов отдать левее, чтобы ранг разреза был n·j/p
+        take = bounds[-1] * j // parts - sum(lo - start for lo, (start, _) in zip(low, runs))
+        for c, lo, hi in zip(cuts, low, high):
+            k = min(max(take, 0), hi - lo)
+            c.append(lo + k)
+            take -= k
+    for c, (_, stop) in zip(cuts, runs):
+        c.append(stop)
+    return cuts
+
+
+def parallel_sort(a: MutableSequence, processes: int = None) -> MutableSequence:
+    """Параллельная сортировка слиянием
+    - Для чисел: list, array.array или одномерный массив NumPy
+    - Списки, которые нельзя без потерь уложить в int64 или double
+      (смешанные int и float, bool, длинные int), сортируются sorted()
+    - Время: O(n log n / p) при p процессах
+    - Память: O(n) в разделяемой памяти
+    """
+    n = len(a)
+    processes = processes or cpu_count() or 1
+    typecode = None
+    if n >= PARALLEL_SORT_CUTOFF and processes > 1:
+        try:
+            typecode = _typecode(a)
+        except TypeError:
+            # Смешанные списки и целые шире 64 бит сортируются в одном процессе
+            if not isinstance(a, list):
+                raise
+    if typecode is None:
+        if np is not None and isinstance(a, np.ndarray):
+            a.sort()
+        elif isinstance(a, array):
+            a[:] = array(a.typecode, sorted(a))
+        else:
+            a[:] = sorted(a)
+        return a
+
+    itemsize = array(typecode).itemsize
+    source = SharedMemory(create=True, size=n * itemsize)
+    target = SharedMemory(create=True, size=n * itemsize)
+    try:
+        with _Buffer(source.name, typecode, n) as data:
+            data[:] = a if not isinstance(a, list) else array(typecode, a)
+        bounds = _bounds(n, processes)
+        with ProcessPoolExecutor(processes) as pool:
+            for f in [pool.submit(_sort_run, source.name, typecode, n, start, stop)
+                      for start, stop in zip(bounds, bounds[1:])]:
+                f.result()
+            with _Buffer(source.name, typecode, n) as data:
+                splitters = _splitters(data, bounds, processes)
+                cuts = _cuts(data, bounds, splitters)
+            futures, offset = [], 0
+            for part in range(processes):
+                runs = [(c[part], c[part + 1]) for c in cuts]
+                futures.append(pool.submit(_merge_runs, source.name, target.name, typecode, n, runs, offset))
+                offset += sum(stop - start for start, stop in runs)
+            for f in futures:
+                f.result()
+        with _Buffer(target.name, typecode, n) as result:
+            if isinstance(a, list):
+                a[:] = result.tolist()
+            elif isinstance(a, array):
+                a[:] = array(typecode, result.tobytes())
+            else:
+                a[:] = result
+    finally:
+        for shm in source, target:
+            shm.close()
+            shm.unlink()
+    return a
@@ -0,0 +1,159 @@
+"""Сортировки целых чисел без сравнений: подсчётом и поразрядная (LSD)
+
+Работают со списками, array.array и массивами NumPy (если установлен).
+Сортировка выполняется на месте, как и в остальных функциях i146.sorting.
+"""
+from array import array
+from itertools import chain, repeat
+from typing import Any, Callable, MutableSequence, Sequence
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# Диапазон ключей, до которого выгоднее сортировка подсчётом
+COUNTING_SORT_RANGE = 1 << 16
+# Ширина разряда поразрядной сортировки: NumPy / чистый Python
+RADIX_BITS = 16
+PY_RADIX_BITS = 8
+
+Key = Callable[[Any], int]
+INTEGER_TYPECODES = 'bBhHiIlLqQ'
+
+
+def _check_integers(keys: Sequence) -> None:
+    for t in set(map(type, keys)):
+        if not issubclass(t, int) and not (np is not None and issubclass(t, np.integer)):
+            raise TypeError(f'Integer keys required, got {t.__name__}')
+
+
+def _keys(a: Sequence, key: Key = None) -> Any:
+    if key is None and np is not None and isinstance(a, np.ndarray):
+        if not np.issubdtype(a.dtype, np.integer):
+            raise TypeError(f'Integer keys required, got an array of {a.dtype}')
+        return a
+    keys = list(map(key, a)) if key is not None else a
+    if not (key is None and isinstance(a, array) and a.typecode in INTEGER_TYPECODES):
+        _check_integers(keys)
+    if np is None:
+        return list(keys)
+    try:
+        return np.fromiter(keys, dtype=np.int64, count=len(a))
+    except OverflowError:
+        # Ключи шире 64 бит сортируем без NumPy
+        return list(keys)
+
+
+def _store(a: MutableSequence, values: Any) -> MutableSequence:
+    if np is not None and isinstance(values, np.ndarray) and not isinstance(a, np.ndarray):
+        values = values.tolist()
+    if isinstance(a, array):
+        values = array(a.typecode, values)
+    a[:] = values
+    return a
+
+
+def _permute(a: MutableSequence, order: Any) -> MutableSequence:
+    if np is not None and isinstance(a, np.ndarray):
+        return _store(a, a[order])
+    return _store(a, [a[i] for i in order])
+
+
+def _use_counting(n: int, low: int, high: int) -> bool:
+    k = high - low + 1
+    return k <= COUNTING_SORT_RANGE or k <= 2 * n
+
+
+def _np_argsort(keys: Any) -> Any:
+    # Смещение считаем в uint64: вычитание по модулю 2⁶⁴ даёт k - min без переполнения
+    offset = keys.astype(np.uint64) - keys.min().astype(np.uint64)
+    order = None
+    mask = np.uint64((1 << RADIX_BITS) - 1)
+    for shift in map(np.uint64, range(0, max(int(offset.max()).bit_length(), 1), RADIX_BITS)):
+        # Устойчивая сортировка NumPy по 16-битному разряду — это проход подсчётом
+        digit = (offset >> shift) & mask if order is None else (offset[order] >> shift) & mask
+        step = np.argsort(digit.astype(np.uint16), kind='stable')
+        order = step if order is None else order[step]
+    return order
+
+
+def _py_argsort(keys: list[int], counting: bool) -> list[int]:
+    low = min(keys)
+    if counting:
+        buckets = [[] for _ in range(max(keys) - low + 1)]
+        for i, k in enumerate(keys):
+            buckets[k - low].append(i)
+        return list(chain.from_iterable(buckets))
+    order = list(range(len(keys)))
+    offset = [k - low for k in keys]
+    mask = (1 << PY_RADIX_BITS) - 1
+    for shift in range(0, max(offset).bit_length(), PY_RADIX_BITS):
+        buckets = [[] for _ in range(mask + 1)]
+        for i in order:
+            buckets[(offset[i] >> shift) & mask].append(i)
+        order = list(chain.from_iterable(buckets))
+    return order
+
+
+def _argsort(keys: Any, counting: bool = None) -> Any:
+    if np is not None and isinstance(keys, np.ndarray):
+        return _np_argsort(keys) if len(keys) else np.arange(0)
+    if not keys:
+        return []
+    if counting is None:
+        counting = _use_counting(len(keys), min(keys), max(keys))
+    return _py_argsort(keys, counting)
+
+
+def argsort(keys: Sequence[int]) -> Sequence[int]:
+    """Устойчивая перестановка, упорядочивающая целые ключи
+    - Время: O(n + k) подсчётом или O(n·w/r) поразрядно
+    """
+    return _argsort(_keys(keys))
+
+
+def _counting_sort(a: MutableSequence, keys: Any, low: int, high: int) -> MutableSequence:
+    if np is not None and isinstance(keys, np.ndarray):
+        counts = np.bincount((keys - keys.dtype.type(low)).astype(np.intp), minlength=high - low + 1)
+        return _store(a, np.repeat(np.arange(low, high + 1, dtype=keys.dtype), counts))
+    counts = [0] * (high - low + 1)
+    for k in keys:
+        counts[k - low] += 1
+    return _store(a, list(chain.from_iterable(repeat(low + i, c) for i, c in enumerate(counts) if c)))
+
+
+def counting_sort(a: MutableSequence, key: Key = None) -> MutableSequence:
+    """Сортировка подсчётом
+    - Устойчивая
+    - Время: O(n + k), k — диапазон ключей
+    - Память: O(n + k)
+    """
+    if len(a) < 2:
+        return a
+    keys = _keys(a, key)
+    if key is not None:
+        return _permute(a, _argsort(keys, counting=True))
+    return _counting_sort(a, keys, int(min(keys)), int(max(keys)))
+
+
+def radix_sort(a: MutableSequence, key: Key = None) -> MutableSequence:
+    """Поразрядная сортировка (LSD)
+    - Устойчивая
+    - Время: O(n·w/r), w — разрядность ключей, r — ширина разряда
+    - Память: O(n)
+    """
+    if len(a) < 2:
+        return a
+    return _permute(a, _argsort(_keys(a, key), counting=False))
+
+
+def integer_sort(a: MutableSequence, key: Key = None) -> MutableSequence:
+    """Сортировка целых ключей: подсчётом при узком диапазоне, иначе поразрядная"""
+    if len(a) < 2:
+        return a
+    keys = _keys(a, key)
+    low, high = int(min(keys)), int(max(keys))
+    if key is None and _use_counting(len(keys), low, high):
+        return _counting_sort(a, keys, low, high)
+    return _permute(a, _argsort(keys))
@@ -0,0 +1,267 @@
+"""Пошаговые версии алгоритмов сортировки для визуализации
+
+Генераторы сортируют список на месте и выдают компактные события
+вместо копий списка, поэтому память не зависит от числа шагов:
+
+- (Step.COMPARE, i, j) — сравнение a[i] и a[j]; j равно None, если a[i]
+  сравнивается с удерживаемым значением (вставляемым или опорным элементом);
+- (Step.SWAP, i, j) — обмен a[i] и a[j] (уже выполнен);
+- (Step.WRITE, i, v) — запись a[i] = v (уже выполнена).
+
+Кроме сортировок есть пошаговые select и partial_sort (без key и reverse).
+Обычные функции i146.sorting не инструментированы и ничего не теряют
+в скорости; count() подсчитывает операции по событиям генератора.
+"""
+from dataclasses import dataclass
+from enum import IntEnum
+from typing import Any, Callable, Generator, Iterable
+
+from i146.sorting import (
+    INSERTION_SORT_CUTOFF,
+    NINTHER_CUTOFF,
+    _median_of_medians,
+    bubble_sort,
+    insertion_sort,
+    partial_sort,
+    quickSort,
+    select,
+    selection_sort,
+)
+
+
+class Step(IntEnum):
+    COMPARE = 0
+    SWAP = 1
+    WRITE = 2
+
+
+COMPARE, SWAP, WRITE = Step.COMPARE, Step.SWAP, Step.WRITE
+
+Event = tuple[Step, int, Any]
+Steps = Generator[Event, None, Any]
+
+
+def bubble_sort_steps(a: list) -> Steps:
+    n = len(a)
+    for i in range(n - 1):
+        swapped = False
+        for j in range(n - i - 1):
+            yield COMPARE, j, j + 1
+            if a[j] > a[j + 1]:
+                a[j], a[j + 1] = a[j + 1], a[j]
+                yield SWAP, j, j + 1
+                swapped = True
+        if not swapped:
+            return
+
+
+def selection_sort_steps(a: list) -> Steps:
+    n = len(a)
+    for i in range(n):
+        min_index = i
+        for j in range(i + 1, n):
+            yield COMPARE, j, min_index
+            if a[j] < a[min_index]:
+                min_index = j
+        a[i], a[min_index] = a[min_index], a[i]
+        yield SWAP, i, min_index
+
+
+def _insertion_sort_steps(a: list, low: int, high: int) -> Steps:
+    for i in range(low + 1, high + 1):
+        x = a[i]
+        j = i - 1
+        while j >= low:
+            yield COMPARE, j, None
+            if not x < a[j]:
+                break
+            a[j + 1] = a[j]
+            yield WRITE, j + 1, a[j]
+            j -= 1
+        if j + 1 != i:
+            a[j + 1] = x
+            yield WRITE, j + 1, x
+
+
+def insertion_sort_steps(a: list) -> Steps:
+    yield from _insertion_sort_steps(a, 0, len(a) - 1)
+
+
+def _sift_down_steps(a: list, low: int, root: int, n: int) -> Steps:
+    x = a[low + root]
+    while (child := 2 * root + 1) < n:
+        if child + 1 < n:
+            yield COMPARE, low + child, low + child + 1
+            if a[low + child] < a[low + child + 1]:
+                child += 1
+        yield COMPARE, low + child, None
+        if not x < a[low + child]:
+            break
+        a[low + root] = a[low + child]
+        yield WRITE, low + root, a[low + root]
+        root = child
+    a[low + root] = x
+    yield WRITE, low + root, x
+
+
+def _heapsort_steps(a: list, low: int, high: int) -> Steps:
+    n = high - low + 1
+    for root in range(n // 2 - 1, -1, -1):
+        yield from _sift_down_steps(a, low, root, n)
+    for end in range(n - 1, 0, -1):
+        a[low], a[low + end] = a[low + end], a[low]
+        yield SWAP, low, low + end
+        yield from _sift_down_steps(a, low, 0, end)
+
+
+def _median_of_three_steps(a: list, i: int, j: int, k: int) -> Generator[Event, None, int]:
+    yield COMPARE, i, j
+    if a[i] < a[j]:
+        yield COMPARE, j, k
+        if a[j] < a[k]:
+            return j
+        yield COMPARE, i, k
+        return k if a[i] < a[k] else i
+    yield COMPARE, i, k
+    if a[i] < a[k]:
+        return i
+    yield COMPARE, j, k
+    return k if a[j] < a[k] else j
+
+
+def _pivot_steps(a: list, low: int, high: int) -> Generator[Event, None, int]:
+    mid = (low + high) // 2
+    if high - low < NINTHER_CUTOFF:
+        return (yield from _median_of_three_steps(a, low, mid, high))
+    step = (high - low) // 8
+    return (yield from _median_of_three_steps(
+        a,
+        (yield from _median_of_three_steps(a, low, low + step, low + 2 * step)),
+        (yield from _median_of_three_steps(a, mid - step, mid, mid + step)),
+        (yield from _median_of_three_steps(a, high - 2 * step, high - step, high)),
+    ))
+
+
+def _partition3_steps(a: list, low: int, high: int, pivot: Any) -> Generator[Event, None, tuple[int, int]]:
+    lt, i, gt = low, low, high
+    while i <= gt:
+        x = a[i]
+        yield COMPARE, i, None
+        if x < pivot:
+            a[lt], a[i] = x, a[lt]
+            yield SWAP, lt, i
+            lt += 1
+            i += 1
+            continue
+        yield COMPARE, i, None
+        if pivot < x:
+            a[gt], a[i] = x, a[gt]
+            yield SWAP, gt, i
+            gt -= 1
+        else:
+            i += 1
+    return lt, gt
+
+
+def _introsort_steps(a: list, low: int, high: int) -> Steps:
+    stack = [(low, high, 2 * (high - low + 1).bit_length())]
+    while stack:
+        low, high, depth = stack.pop()
+        while high - low >= INSERTION_SORT_CUTOFF:
+            if not depth:
+                yield from _heapsort_steps(a, low, high)
+                break
+            depth -= 1
+            pivot = a[(yield from _pivot_steps(a, low, high))]
+            lt, gt = yield from _partition3_steps(a, low, high, pivot)
+            if lt - low < high - gt:
+                stack.append((gt + 1, high, depth))
+                high = lt - 1
+            else:
+                stack.append((low, lt - 1, depth))
+                low = gt + 1
+        else:
+            yield from _insertion_sort_steps(a, low, high)
+
+
+def quick_sort_steps(a: list) -> Steps:
+    if len(a) < 2:
+        return
+    yield from _introsort_steps(a, 0, len(a) - 1)
+
+
+def _introselect_steps(a: list, k: int, low: int, high: int) -> Steps:
+    size, partitions, slow = high - low + 1, 0, False
+    while high - low >= INSERTION_SORT_CUTOFF:
+        if slow:
+            # Медиана медиан выбирается на копиях групп и не меняет a, событий нет
+            pivot = _median_of_medians(a, low, high)
+        else:
+            pivot = a[(yield from _pivot_steps(a, low, high))]
+        lt, gt = yield from _partition3_steps(a, low, high, pivot)
+        if k < lt:
+            high = lt - 1
+        elif k > gt:
+            low = gt + 1
+        else:
+            return
+        partitions += 1
+        if partitions == 2:
+            slow = 2 * (high - low + 1) > size
+            size, partitions = high - low + 1, 0
+    yield from _insertion_sort_steps(a, low, high)
+
+
+def select_steps(a: list, k: int) -> Steps:
+    n = len(a)
+    if k < 0:
+        k += n
+    if not 0 <= k < n:
+        raise IndexError('selection index out of range')
+    yield from _introselect_steps(a, k, 0, n - 1)
+    return a[k]
+
+
+def partial_sort_steps(a: list, k: int) -> Steps:
+    n = len(a)
+    k = max(0, min(k, n))
+    if not k:
+        return
+    if k < n:
+        yield from _introselect_steps(a, k - 1, 0, n - 1)
+    yield from _introsort_steps(a, 0, k - 1)
+
+
+STEPS: dict[Callable[..., Any], Callable[..., Steps]] = {
+    bubble_sort: bubble_sort_steps,
+    selection_sort: selection_sort_steps,
+    insertion_sort: insertion_sort_steps,
+    quickSort: quick_sort_steps,
+    select: select_steps,
+    partial_sort: partial_sort_steps,
+}
+
+
+def steps(algorithm: Callable[..., Any] | str, a: list, *args: Any) -> Steps:
+    """События сортировки a алгоритмом (функцией i146.sorting или её именем)
+
+    Дополнительные аргументы передаются алгоритму: steps('select', a, k).
+    """
+    if isinstance(algorithm, str):
+        algorithm = {f.__name__: f for f in STEPS}[algorithm]
+    return STEPS[algorithm](a, *args)
+
+
+@dataclass
+class Counts:
+    comparisons: int = 0
+    swaps: int = 0
+    writes: int = 0
+
+
+def count(events: Iterable[Event]) -> Counts:
+    """Подсчёт операций по потоку событий за O(1) памяти"""
+    counts = [0, 0, 0]
+    for step, _, _ in events:
+        counts[step] += 1
+    return Counts(*counts)
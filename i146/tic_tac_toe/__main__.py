@@ -1,7 +1,12 @@
 from .game import Game
-from .players import HardcodedPlayer, HumanPlayer, MinimaxPlayer, RandomPlayer
+from .players import HardcodedPlayer, RandomPlayer
 
 
-g = Game(HardcodedPlayer(), RandomPlayer())
-r = g.play()
-print(r)
+def main() -> None:
+    g = Game(HardcodedPlayer(), RandomPlayer())
+    r = g.play()
+    print(r)
+
+
+if __name__ == '__main__':
+    main()
@@ -1,12 +1,19 @@
 from abc import ABCMeta, abstractmethod
+from time import perf_counter
+from typing import Optional
 
 from .board import Board, Mark
+from .metrics import Metrics, Move
 
 
 class Player(metaclass=ABCMeta):
+    # Search nodes visited, counted by players that search while metrics are on
+    nodes = 0
+
     def __init__(self, mark: Mark = None, name: str = None) -> None:
         self.__mark = mark
         self._name = name
+        self.metrics: Optional[Metrics] = None
 
     @property
     def mark(self) -> Mark:
@@ -36,4 +43,11 @@ class Player(metaclass=ABCMeta):
         ...
 
     def place_mark(self, board: Board) -> Board:
-        return board.place_mark(self._index(board), self.mark)
+        if self.metrics is None:
+            return board.place_mark(self._index(board), self.mark)
+        nodes = self.nodes
+        start = perf_counter()
+        index = self._index(board)
+        seconds = perf_counter() - start
+        self.metrics.record(Move(self.name, int(self.mark), board.turn, index, seconds, self.nodes - nodes))
+        return board.place_mark(index, self.mark)
@@ -1,20 +1,46 @@
+from typing import Optional
+
 from .board import Board, Mark
+from .gamelog import GameLogWriter
+from .metrics import Metrics
 from .players import Player
 
 
 class Game:
-    def __init__(self, player1: Player, player2: Player) -> None:
+    def __init__(
+        self,
+        player1: Player,
+        player2: Player,
+        metrics: Optional[Metrics] = None,
+        log: Optional[GameLogWriter] = None,
+    ) -> None:
         player1.mark = Mark.X
         player2.mark = Mark.O
         self.__players = player1, player2
         self.__board = Board()
+        self.__metrics = metrics
+        self.__log = log
+        self.__moves: list[int] = []
 
     def play(self) -> Mark:
-        print(self.__board)
-        while self.__board.result is None:
+        # The collector is attached only for this game, so players reused in
+        # another game without metrics do not keep recording into it
+        for p in self.__players:
+            p.metrics = self.__metrics
+        try:
+            print(self.__board)
+            while self.__board.result is None:
+                for p in self.__players:
+                    self.__board = p.place_mark(self.__board)
+                    self.__moves.append(self.__board.last)
+                    print(f'{p}:\n{self.__board}')
+                    if self.__board.result is not None:
+                        break
+        finally:
             for p in self.__players:
-                self.__board = p.place_mark(self.__board)
-                print(f'{p}:\n{self.__board}')
-                if self.__board.result is not None:
-                    break
+                p.metrics = None
+        if self.__metrics is not None:
+            self.__metrics.end_game(self.__board.result)
+        if self.__log is not None:
+            self.__log.write(self.__moves, self.__board.result)
         return self.__board.result
@@ -0,0 +1,168 @@
+"""Append-only binary log of finished games
+
+Every game is one little-endian 64-bit record after an 8-byte header:
+
+- bits 0..35 — up to 9 moves, 4 bits each: cell index + 1, 0 after the last move;
+- bits 36..39 — result + 1 (0 — O won, 1 — draw, 2 — X won).
+
+X always moves first. Fixed-size records make the file memory-mappable,
+and the reader answers aggregate queries with vectorized scans over all
+records (NumPy when installed) instead of replaying games through Board.
+"""
+import mmap
+import struct
+from array import array
+from collections import Counter
+from pathlib import Path
+from typing import Any, BinaryIO, Iterator, Sequence
+
+from .board import Mark
+
+MAGIC = b'I146TTT1'
+RECORD = struct.Struct('<Q')
+MOVE_BITS = 4
+MOVE_MASK = (1 << MOVE_BITS) - 1
+MAX_MOVES = 9
+RESULT_SHIFT = MOVE_BITS * MAX_MOVES
+POWERS_OF_3 = [0] + [3 ** i for i in range(MAX_MOVES)]
+
+
+def encode(moves: Sequence[int], result: Mark) -> int:
+    if len(moves) > MAX_MOVES:
+        raise ValueError(f'A game has at most {MAX_MOVES} moves, got {len(moves)}')
+    record = (int(result) + 1) << RESULT_SHIFT
+    for i, cell in enumerate(moves):
+        record |= (cell + 1) << (MOVE_BITS * i)
+    return record
+
+
+def decode(record: int) -> tuple[list[int], Mark]:
+    moves = []
+    for i in range(MAX_MOVES):
+        cell = (record >> (MOVE_BITS * i)) & MOVE_MASK
+        if not cell:
+            break
+        moves.append(cell - 1)
+    return moves, Mark(((record >> RESULT_SHIFT) & MOVE_MASK) - 1)
+
+
+def _numpy() -> Any:
+    try:
+        import numpy
+    except ImportError:
+        return None
+    return numpy
+
+
+class GameLogWriter:
+    def __init__(self, path: str | Path) -> None:
+        self.__file: BinaryIO = open(path, 'ab')
+        size = self.__file.tell()
+        if size == 0:
+            self.__file.write(MAGIC)
+        else:
+            with open(path, 'rb') as f:
+                if f.read(len(MAGIC)) != MAGIC:
+                    self.__file.close()
+                    raise ValueError(f'{path} is not a game log')
+            # Drop a record cut short by an interrupted append, so new records stay aligned
+            aligned = len(MAGIC) + (size - len(MAGIC)) // RECORD.size * RECORD.size
+            if aligned != size:
+                self.__file.truncate(aligned)
+
+    def write(self, moves: Sequence[int], result: Mark) -> None:
+        self.__file.write(RECORD.pack(encode(moves, result)))
+
+    def flush(self) -> None:
+        self.__file.flush()
+
+    def close(self) -> None:
+        self.__file.close()
+
+    def __enter__(self) -> 'GameLogWriter':
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.close()
+
+
+class GameLogReader:
+    def __init__(self, path: str | Path) -> None:
+        with open(path, 'rb') as f:
+            if f.read(len(MAGIC)) != MAGIC:
+                raise ValueError(f'{path} is not a game log')
+            size = f.seek(0, 2)
+            self.__mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        # A record cut short by an interrupted append is ignored (and dropped by the next writer)
+        self.__count = (size - len(MAGIC)) // RECORD.size
+        self.__np = _numpy()
+        if self.__np is not None:
+            self.records = self.__np.frombuffer(self.__mmap, dtype='<u8', count=self.__count, offset=len(MAGIC))
+        else:
+            self.records = array('Q', self.__mmap[len(MAGIC):len(MAGIC) + self.__count * RECORD.size])
+
+    def __len__(self) -> int:
+        return self.__count
+
+    def __iter__(self) -> Iterator[tuple[list[int], Mark]]:
+        for record in self.records:
+            yield decode(int(record))
+
+    def close(self) -> None:
+        self.records = None
+        self.__mmap.close()
+
+    def __enter__(self) -> 'GameLogReader':
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.close()
+
+    def openings(self, depth: int = 1) -> Counter[tuple[int, ...]]:
+        """How often each sequence of the first `depth` moves was played"""
+        mask = (1 << (MOVE_BITS * depth)) - 1
+        if self.__np is not None:
+            prefixes, counts = self.__np.unique(self.records & self.__np.uint64(mask), return_counts=True)
+        else:
+            c = Counter(r & mask for r in self.records)
+            prefixes, counts = list(c.keys()), list(c.values())
+        return Counter({tuple(decode(int(p))[0]): int(n) for p, n in zip(prefixes, counts)})
+
+    def win_rates(self) -> dict[int, dict[Mark, float]]:
+        """Share of X wins, O wins and draws by the first move of X"""
+        if self.__np is not None:
+            np = self.__np
+            first = (self.records & np.uint64(MOVE_MASK)).astype(np.int64)
+            result = ((self.records >> np.uint64(RESULT_SHIFT)) & np.uint64(MOVE_MASK)).astype(np.int64)
+            table = np.bincount(first * 3 + result, minlength=(MAX_MOVES + 1) * 3).reshape(-1, 3).tolist()
+        else:
+            table = [[0] * 3 for _ in range(MAX_MOVES + 1)]
+            for r in self.records:
+                table[r & MOVE_MASK][(r >> RESULT_SHIFT) & MOVE_MASK] += 1
+        rates = {}
+        for cell, counts in enumerate(table[1:]):
+            if total := sum(counts):
+                rates[cell] = {Mark(i - 1): n / total for i, n in enumerate(counts)}
+        return rates
+
+    def positions(self) -> Counter[int]:
+        """How often each position occurred, by its Board hash (ternary_to_decimal code)"""
+        if self.__np is None:
+            c = Counter()
+            for moves, _ in self:
+                code = 0
+                for i, cell in enumerate(moves):
+                    code += (1 if i % 2 == 0 else -1) * POWERS_OF_3[cell + 1]
+                    c[code] += 1
+            return c
+        np = self.__np
+        powers = np.array(POWERS_OF_3, dtype=np.int64)
+        codes = np.zeros(len(self.records), dtype=np.int64)
+        seen = []
+        for i in range(MAX_MOVES):
+            cell = ((self.records >> np.uint64(MOVE_BITS * i)) & np.uint64(MOVE_MASK)).astype(np.int64)
+            played = cell != 0
+            codes += (1 if i % 2 == 0 else -1) * powers[cell]
+            seen.append(codes[played])
+        values, counts = np.unique(np.concatenate(seen), return_counts=True)
+        return Counter(dict(zip(values.tolist(), counts.tolist())))
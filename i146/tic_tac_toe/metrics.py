@@ -0,0 +1,149 @@
+"""Opt-in per-move metrics for tic-tac-toe players
+
+    metrics = Metrics()
+    Game(MinimaxPlayer(), RandomPlayer(), metrics=metrics).play()
+    print(metrics.to_prometheus())
+
+Players publish their search node counts only while a collector is attached.
+MinimaxPlayer counts nodes in locals of the search and adds the total to
+`Player.nodes` after the move; without a collector the counters stay zero.
+Each move's latency and node count are keyed by player name and mark, so
+two players of the same class get separate series.
+"""
+import json
+from bisect import bisect_left
+from dataclasses import asdict, dataclass, field
+from typing import Any, Callable, Optional
+
+LATENCY_BUCKETS = (1e-6, 1e-5, 1e-4, 1e-3, 1e-2, 1e-1, 1.0, 10.0)
+NODES_BUCKETS = (1, 10, 100, 1_000, 10_000, 100_000, 1_000_000)
+
+
+def _escape(label: str) -> str:
+    return label.replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+def _labels(player: str, mark: int) -> str:
+    return f'player="{_escape(player)}",mark="{mark}"'
+
+
+@dataclass
+class Move:
+    player: str
+    mark: int
+    turn: int
+    index: int
+    seconds: float
+    nodes: int = 0
+
+
+@dataclass
+class Histogram:
+    buckets: tuple[float, ...]
+    counts: list[int] = field(default=None)
+    sum: float = 0
+    count: int = 0
+
+    def __post_init__(self) -> None:
+        if self.counts is None:
+            self.counts = [0] * (len(self.buckets) + 1)
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect_left(self.buckets, value)] += 1
+        self.sum += value
+        self.count += 1
+
+    def cumulative(self) -> list[tuple[str, int]]:
+        result, total = [], 0
+        for le, c in zip((*map(str, self.buckets), '+Inf'), self.counts):
+            total += c
+            result.append((le, total))
+        return result
+
+
+@dataclass
+class PlayerMetrics:
+    latency: Histogram = field(default_factory=lambda: Histogram(LATENCY_BUCKETS))
+    nodes: Histogram = field(default_factory=lambda: Histogram(NODES_BUCKETS))
+    moves: int = 0
+
+    def observe(self, move: Move) -> None:
+        self.moves += 1
+        self.latency.observe(move.seconds)
+        self.nodes.observe(move.nodes)
+
+
+@dataclass
+class GameMetrics:
+    moves: list[Move] = field(default_factory=list)
+    result: Optional[int] = None
+
+    @property
+    def seconds(self) -> float:
+        return sum(m.seconds for m in self.moves)
+
+    @property
+    def nodes(self) -> int:
+        return sum(m.nodes for m in self.moves)
+
+
+class Metrics:
+    """Collects moves of one game at a time and aggregates them over a tournament
+
+    Finished games are kept only with keep_games=True; otherwise memory
+    stays constant however many games are played.
+    """
+
+    def __init__(self, keep_games: bool = False, on_move: Callable[[Move], None] = None) -> None:
+        self.keep_games = keep_games
+        self.on_move = on_move
+        self.players: dict[tuple[str, int], PlayerMetrics] = {}
+        self.results: dict[int, int] = {}
+        self.games: list[GameMetrics] = []
+        self.game = GameMetrics()
+
+    def record(self, move: Move) -> None:
+        seat = move.player, move.mark
+        if seat not in self.players:
+            self.players[seat] = PlayerMetrics()
+        self.players[seat].observe(move)
+        self.game.moves.append(move)
+        if self.on_move is not None:
+            self.on_move(move)
+
+    def end_game(self, result: int) -> GameMetrics:
+        game, self.game = self.game, GameMetrics()
+        game.result = int(result)
+        self.results[game.result] = self.results.get(game.result, 0) + 1
+        if self.keep_games:
+            self.games.append(game)
+        return game
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            'games': sum(self.results.values()),
+            'results': {str(k): v for k, v in sorted(self.results.items())},
+            'players': [{'player': name, 'mark': mark, **asdict(m)} for (name, mark), m in self.players.items()],
+            'history': [asdict(g) for g in self.games],
+        }
+
+    def to_json(self, **kwargs: Any) -> str:
+        return json.dumps(self.to_dict(), **kwargs)
+
+    def to_prometheus(self, prefix: str = 'tic_tac_toe') -> str:
+        lines = [
+            f'# HELP {prefix}_games_total Finished games by result (1 = X, -1 = O, 0 = draw)',
+            f'# TYPE {prefix}_games_total counter',
+        ]
+        lines += [f'{prefix}_games_total{{result="{r}"}} {n}' for r, n in sorted(self.results.items())]
+        for metric, description, attr in (
+            ('move_seconds', 'Wall time per move', 'latency'),
+            ('move_nodes', 'Search nodes per move', 'nodes'),
+        ):
+            lines += [f'# HELP {prefix}_{metric} {description}', f'# TYPE {prefix}_{metric} histogram']
+            for seat, m in self.players.items():
+                h: Histogram = getattr(m, attr)
+                label = _labels(*seat)
+                lines += [f'{prefix}_{metric}_bucket{{{label},le="{le}"}} {c}' for le, c in h.cumulative()]
+                lines += [f'{prefix}_{metric}_sum{{{label}}} {h.sum}', f'{prefix}_{metric}_count{{{label}}} {h.count}']
+        return '\n'.join(lines) + '\n'
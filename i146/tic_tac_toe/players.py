@@ -44,17 +44,20 @@ class MinimaxPlayer(Player):
         mark: Mark,
         alpha: int = -10,
         beta: int = 10,
-    ) -> tuple[int, Optional[int]]:
+    ) -> tuple[int, Optional[int], int]:
+        # The last item is the number of nodes visited, counted locally
         if board.turn == 0:
-            return 1, 0
+            return 1, 0, 1
         if board.turn == 1:
-            return -1, (4 if board[4] is Mark.N else 0)
+            return -1, (4 if board[4] is Mark.N else 0), 1
         if (r := board.result) is not None:
-            return r, None
+            return r, None, 1
+        nodes = 1
         if mark is Mark.X:
             weight = -10
             for i in board.empty:
-                w = self.__minimax(board.place_mark(i, mark), ~mark, alpha, beta)[0]
+                w, _, n = self.__minimax(board.place_mark(i, mark), ~mark, alpha, beta)
+                nodes += n
                 if w > weight:
                     weight, index = w, i
                 alpha = max(alpha, weight)
@@ -63,16 +66,20 @@ class MinimaxPlayer(Player):
         else:
             weight = 10
             for i in board.empty:
-                w = self.__minimax(board.place_mark(i, mark), ~mark, alpha, beta)[0]
+                w, _, n = self.__minimax(board.place_mark(i, mark), ~mark, alpha, beta)
+                nodes += n
                 if w < weight:
                     weight, index = w, i
                 beta = min(beta, weight)
                 if beta <= alpha:
                     break
-        return weight, index
+        return weight, index, nodes
 
     def _index(self, board: Board) -> int:
-        return self.__minimax(board, self.mark)[1]
+        _, index, nodes = self.__minimax(board, self.mark)
+        if self.metrics is not None:
+            self.nodes += nodes
+        return index
 
 
 class HardcodedPlayer(Player):
@@ -1,12 +1,25 @@
+from functools import lru_cache
+
+DIGITS = '0123456789'
+SUBSCRIPT_DIGITS = '₀₁₂₃₄₅₆₇₈₉'
+SUPERSCRIPT_DIGITS = '⁰¹²³⁴⁵⁶⁷⁸⁹'
+
+SUBSCRIPT = str.maketrans(DIGITS + '+-', SUBSCRIPT_DIGITS + '₊₋')
+SUPERSCRIPT = str.maketrans(DIGITS + '+-', SUPERSCRIPT_DIGITS + '⁺⁻')
+FROM_SUBSCRIPT = str.maketrans(SUBSCRIPT_DIGITS, DIGITS)
+WITHOUT_SUBSCRIPT = str.maketrans('', '', SUBSCRIPT_DIGITS)
+
+
+@lru_cache(maxsize=256)
 def line(width: int) -> str:
-    return '\u2500' * width
+    return '─' * width
 
 
+@lru_cache(maxsize=256)
 def subscript(x: int) -> str:
-    if x == 0:
-        return '₀'
-    s = []
-    while x:
-        x, d = divmod(x, 10)
-        s.append(chr(0x2080 + d))
-    return ''.join(reversed(s))
+    return str(x).translate(SUBSCRIPT)
+
+
+@lru_cache(maxsize=256)
+def superscript(x: int) -> str:
+    return str(x).translate(SUPERSCRIPT)